@@ -81,6 +81,7 @@ from src import (
     StructuredLogger,
     __version__
 )
+from src.utils import shutdown_io_executor
 
 # Optional tool imports (server must start even if these are missing)
 try:
@@ -147,7 +148,7 @@ class ExecuteCommandParams(BaseModel):
 class ProcessListParams(BaseModel):
     filters: Optional[Dict[str, Any]] = Field(
         None,
-        description="Filters: name, user, status, min_cpu, min_memory, sort_by, limit"
+        description="Filters: name, user, status, min_cpu, min_memory, sort_by, limit, refresh"
     )
 
 class ProcessInfoParams(BaseModel):
@@ -486,7 +487,9 @@ class PCControlServer:
                             "type": "object",
                             "properties": {
                                 "region": {"oneOf": [{"type": "array"}, {"type": "null"}]},
-                                "save_path": {"oneOf": [{"type": "string"}, {"type": "null"}]}
+                                "save_path": {"oneOf": [{"type": "string"}, {"type": "null"}]},
+                                "return_bytes": {"type": "boolean", "default": False},
+                                "raw_rgb": {"type": "boolean", "default": False}
                             }
                         }
                     )
@@ -642,7 +645,8 @@ class PCControlServer:
                                     "min_cpu": {"type": "number"},
                                     "min_memory": {"type": "number"},
                                     "sort_by": {"type": "string"},
-                                    "limit": {"type": "integer"}
+                                    "limit": {"type": "integer"},
+                                    "refresh": {"type": "boolean"}
                                 }
                             }
                         }
@@ -1210,7 +1214,9 @@ class PCControlServer:
                         raise ValueError("AutomationTools is not available on this system")
                     result = await self.automation_tools.take_screenshot(
                         region=arguments.get("region"),
-                        save_path=arguments.get("save_path")
+                        save_path=arguments.get("save_path"),
+                        return_bytes=arguments.get("return_bytes", False),
+                        raw_rgb=arguments.get("raw_rgb", False)
                     )
 
                 else:
@@ -1247,6 +1253,7 @@ class PCControlServer:
     async def run(self):
         """Run the MCP server."""
         log.info("Starting PC Control MCP Server...")
+        self.system_tools.start_cpu_sampler()
         try:
             log.debug("Creating stdio server...")
             async with stdio_server() as (read_stream, write_stream):
@@ -1335,6 +1342,12 @@ class PCControlServer:
         except Exception as e:
             log.error("Error in server.run", exception=e)
             raise
+        finally:
+            self.system_tools.stop_cpu_sampler()
+            if self.automation_tools:
+                self.automation_tools.close()
+            self.security.close()
+            shutdown_io_executor(wait=False)
 
 
 async def main():
@@ -1363,9 +1376,26 @@ async def main():
         sys.exit(1)
 
 
+def _run_event_loop(coro):
+    """Run the server coroutine, preferring uvloop where it is available.
+    
+    uvloop (libuv) handles subprocess pipes and child reaping more cheaply
+    than the default selector loop, which matters for execute_command-heavy
+    sessions. Windows and environments without uvloop use asyncio.run().
+    """
+    if sys.platform != 'win32':
+        try:
+            import uvloop  # type: ignore
+            if hasattr(uvloop, 'run'):
+                return uvloop.run(coro)
+        except ImportError:
+            pass
+    return asyncio.run(coro)
+
+
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        _run_event_loop(main())
     finally:
         # Cleanup PID file on normal exit
         try:
@@ -1,132 +1,98 @@
 """
 PC Control MCP Server - A secure and powerful system control server.
+
+Public names are resolved lazily (PEP 562): importing ``src`` does not pull
+in the tool subpackages or their heavy optional dependencies until one of
+them is actually accessed.
 """
 
+import importlib
+
 __version__ = "2.0.0"
 __author__ = "PC Control MCP Team"
 
-from .core import (
+# Public name -> submodule that defines it
+_LAZY = {
     # Exceptions
-    PCControlException,
-    SecurityException,
-    AuthenticationException,
-    AuthorizationException,
-    ValidationException,
-    ConfigurationException,
-    SystemException,
-    ProcessException,
-    FileOperationException,
-    NetworkException,
-    ServiceException,
-    RegistryException,
-    AutomationException,
-    MonitoringException,
-    RateLimitException,
-    TimeoutException,
-    ResourceLimitException,
+    'PCControlException': '.core.exceptions',
+    'SecurityException': '.core.exceptions',
+    'AuthenticationException': '.core.exceptions',
+    'AuthorizationException': '.core.exceptions',
+    'ValidationException': '.core.exceptions',
+    'ConfigurationException': '.core.exceptions',
+    'SystemException': '.core.exceptions',
+    'ProcessException': '.core.exceptions',
+    'FileOperationException': '.core.exceptions',
+    'NetworkException': '.core.exceptions',
+    'ServiceException': '.core.exceptions',
+    'RegistryException': '.core.exceptions',
+    'AutomationException': '.core.exceptions',
+    'MonitoringException': '.core.exceptions',
+    'RateLimitException': '.core.exceptions',
+    'TimeoutException': '.core.exceptions',
+    'ResourceLimitException': '.core.exceptions',
     
     # Core components
-    StructuredLogger,
-    AuditLogger,
-    setup_logging,
-    ConfigManager,
-    get_config,
-    SecurityManager,
-    User,
-    Operation
-)
+    'StructuredLogger': '.core.logger',
+    'AuditLogger': '.core.logger',
+    'setup_logging': '.core.logger',
+    'ConfigManager': '.core.config',
+    'get_config': '.core.config',
+    'SecurityManager': '.core.security',
+    'User': '.core.security',
+    'Operation': '.core.security',
+    
+    # Tools
+    'SystemTools': '.tools.system_tools',
+    'ProcessTools': '.tools.process_tools',
+    'FileTools': '.tools.file_tools',
+    'NetworkTools': '.tools.network_tools',
+    'ServiceTools': '.tools.service_tools',
+    
+    # Optional tools (ImportError surfaces on first access)
+    'AutomationTools': '.tools.automation_tools',
+    'PowerShellTools': '.tools.powershell_tools',
+    'SchedulerTools': '.tools.scheduler_tools',
+    'UIATools': '.tools.uia_tools',
+    'RegistryTools': '.tools.registry_tools',
+    
+    # Monitoring
+    'MetricsCollector': '.monitoring.metrics_collector',
+    'AlertManager': '.monitoring.metrics_collector',
+    'AlertRule': '.monitoring.metrics_collector',
+}
 
-from .tools import (
-    SystemTools,
-    ProcessTools,
-    FileTools,
-    NetworkTools,
-    ServiceTools
-)
 
-# Import AutomationTools conditionally
-try:
-    from .tools import AutomationTools
-    _automation_exports = ['AutomationTools']
-except ImportError:
-    # AutomationTools requires pyautogui which needs tkinter
-    _automation_exports = []
+# Names whose dependencies may be missing; exported in __all__ only when
+# their requirements are installed, so "from src import *" works everywhere
+_OPTIONAL = frozenset({
+    'AutomationTools',
+    'PowerShellTools',
+    'SchedulerTools',
+    'UIATools',
+    'RegistryTools',
+})
 
-try:
-    from .tools import PowerShellTools
-    _powershell_exports = ['PowerShellTools']
-except ImportError:
-    _powershell_exports = []
 
-try:
-    from .tools import SchedulerTools
-    _scheduler_exports = ['SchedulerTools']
-except ImportError:
-    _scheduler_exports = []
+def __getattr__(name: str):
+    module_path = _LAZY.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
 
-try:
-    from .tools import UIATools
-    _uia_exports = ['UIATools']
-except ImportError:
-    _uia_exports = []
 
-# Conditional import for Windows-only tools
-try:
-    from .tools import RegistryTools
-    _registry_exports = ['RegistryTools']
-except ImportError:
-    _registry_exports = []
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
 
-from .monitoring import (
-    MetricsCollector,
-    AlertManager,
-    AlertRule
-)
 
-__all__ = [
-    # Version
-    '__version__',
-    '__author__',
-    
-    # Exceptions
-    'PCControlException',
-    'SecurityException',
-    'AuthenticationException',
-    'AuthorizationException',
-    'ValidationException',
-    'ConfigurationException',
-    'SystemException',
-    'ProcessException',
-    'FileOperationException',
-    'NetworkException',
-    'ServiceException',
-    'RegistryException',
-    'AutomationException',
-    'MonitoringException',
-    'RateLimitException',
-    'TimeoutException',
-    'ResourceLimitException',
-    
-    # Core
-    'StructuredLogger',
-    'AuditLogger',
-    'setup_logging',
-    'ConfigManager',
-    'get_config',
-    'SecurityManager',
-    'User',
-    'Operation',
-    
-    # Tools
-    'SystemTools',
-    'ProcessTools',
-    'FileTools',
-    'NetworkTools',
-    'ServiceTools',
-    
-    # Monitoring
-    'MetricsCollector',
-    'AlertManager',
-    'AlertRule'
-] + _registry_exports + _automation_exports
-__all__ += _powershell_exports + _scheduler_exports + _uia_exports
\ No newline at end of file
+def _build_all():
+    # src.tools' __init__ is lazy too, so this only probes with find_spec
+    from .tools import _is_available
+    return ['__version__', '__author__'] + [
+        name for name in _LAZY if name not in _OPTIONAL or _is_available(name)
+    ]
+
+
+__all__ = _build_all()
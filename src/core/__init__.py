@@ -1,101 +1,73 @@
 """
 Core functionality for PC Control MCP Server.
-"""
-
-from .exceptions import (
-    PCControlException,
-    SecurityException,
-    AuthenticationException,
-    AuthorizationException,
-    ValidationException,
-    ConfigurationException,
-    SystemException,
-    ProcessException,
-    FileOperationException,
-    NetworkException,
-    ServiceException,
-    RegistryException,
-    AutomationException,
-    MonitoringException,
-    RateLimitException,
-    TimeoutException,
-    ResourceLimitException
-)
-
-from .logger import (
-    StructuredLogger,
-    AuditLogger,
-    setup_logging
-)
 
-from .config import (
-    Config,
-    ConfigManager,
-    get_config,
-    set_config,
-    ServerConfig,
-    SecurityConfig,
-    GuiAutomationConfig,
-    MonitoringConfig,
-    ProcessManagementConfig,
-    NetworkConfig,
-    FileOperationsConfig
-)
+Names are resolved lazily (PEP 562) so that, for example, importing an
+exception class does not load pydantic, yaml, loguru or the security stack.
+"""
 
-from .security import (
-    SecurityManager,
-    User,
-    AuthResult,
-    Operation,
-    SessionManager,
-    RateLimiter,
-    InputValidator
-)
+import importlib
 
-__all__ = [
+# Public name -> submodule that defines it
+_LAZY = {
     # Exceptions
-    'PCControlException',
-    'SecurityException',
-    'AuthenticationException',
-    'AuthorizationException',
-    'ValidationException',
-    'ConfigurationException',
-    'SystemException',
-    'ProcessException',
-    'FileOperationException',
-    'NetworkException',
-    'ServiceException',
-    'RegistryException',
-    'AutomationException',
-    'MonitoringException',
-    'RateLimitException',
-    'TimeoutException',
-    'ResourceLimitException',
+    'PCControlException': '.exceptions',
+    'SecurityException': '.exceptions',
+    'AuthenticationException': '.exceptions',
+    'AuthorizationException': '.exceptions',
+    'ValidationException': '.exceptions',
+    'ConfigurationException': '.exceptions',
+    'SystemException': '.exceptions',
+    'ProcessException': '.exceptions',
+    'FileOperationException': '.exceptions',
+    'NetworkException': '.exceptions',
+    'ServiceException': '.exceptions',
+    'RegistryException': '.exceptions',
+    'AutomationException': '.exceptions',
+    'MonitoringException': '.exceptions',
+    'RateLimitException': '.exceptions',
+    'TimeoutException': '.exceptions',
+    'ResourceLimitException': '.exceptions',
     
     # Logger
-    'StructuredLogger',
-    'AuditLogger',
-    'setup_logging',
+    'StructuredLogger': '.logger',
+    'AuditLogger': '.logger',
+    'setup_logging': '.logger',
     
     # Config
-    'Config',
-    'ConfigManager',
-    'get_config',
-    'set_config',
-    'ServerConfig',
-    'SecurityConfig',
-    'GuiAutomationConfig',
-    'MonitoringConfig',
-    'ProcessManagementConfig',
-    'NetworkConfig',
-    'FileOperationsConfig',
+    'Config': '.config',
+    'ConfigManager': '.config',
+    'get_config': '.config',
+    'set_config': '.config',
+    'ServerConfig': '.config',
+    'SecurityConfig': '.config',
+    'GuiAutomationConfig': '.config',
+    'MonitoringConfig': '.config',
+    'ProcessManagementConfig': '.config',
+    'NetworkConfig': '.config',
+    'FileOperationsConfig': '.config',
     
     # Security
-    'SecurityManager',
-    'User',
-    'AuthResult',
-    'Operation',
-    'SessionManager',
-    'RateLimiter',
-    'InputValidator',
-]
\ No newline at end of file
+    'SecurityManager': '.security',
+    'User': '.security',
+    'AuthResult': '.security',
+    'Operation': '.security',
+    'SessionManager': '.security',
+    'RateLimiter': '.security',
+    'InputValidator': '.security',
+}
+
+
+def __getattr__(name: str):
+    module_path = _LAZY.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+
+__all__ = list(_LAZY)
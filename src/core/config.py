@@ -3,146 +3,232 @@ Configuration management for PC Control MCP Server.
 """
 
 import os
+import copy
+from dataclasses import dataclass, field, asdict
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Union
-from pydantic import BaseModel, Field, field_validator, ValidationError
-import yaml
-from dotenv import load_dotenv
+from typing_extensions import Annotated, Literal
+from annotated_types import Gt, Ge, Le
 
 from .exceptions import ConfigurationException
 from .logger import StructuredLogger
 
 log = StructuredLogger(__name__)
 
+# Constrained field types (checked by pydantic when the file is validated)
+PositiveInt = Annotated[int, Gt(0)]
+Percent = Annotated[int, Ge(0), Le(100)]
 
-class AuthenticationConfig(BaseModel):
+
+@dataclass
+class AuthenticationConfig:
     """Authentication configuration."""
-    type: str = Field(default="none", pattern="^(none|basic|token)$")
-    token_expiry: int = Field(default=3600, gt=0)
+    type: Literal["none", "basic", "token"] = "none"
+    token_expiry: PositiveInt = 3600
+    # bcrypt cost factor (2**rounds iterations); each +1 doubles hash time
+    bcrypt_rounds: Annotated[int, Ge(4), Le(31)] = 12
+    # argon2 needs argon2-cffi; bcrypt stays the default for existing hashes
+    password_hash: Literal["bcrypt", "argon2"] = "bcrypt"
+    argon2_parallelism: PositiveInt = 4
 
 
-class AuthorizationConfig(BaseModel):
+@dataclass
+class AuthorizationConfig:
     """Authorization configuration."""
-    allowed_commands: List[str] = Field(default_factory=list)
-    blocked_paths: List[str] = Field(default_factory=list)
-    max_file_size: int = Field(default=104857600, gt=0)  # 100MB
-    command_timeout: int = Field(default=30, gt=0)
+    allowed_commands: List[str] = field(default_factory=list)
+    blocked_paths: List[str] = field(default_factory=list)
+    max_file_size: PositiveInt = 104857600  # 100MB
+    command_timeout: PositiveInt = 30
 
 
-class AuditConfig(BaseModel):
+@dataclass
+class AuditConfig:
     """Audit configuration."""
-    enabled: bool = Field(default=True)
-    log_all_operations: bool = Field(default=True)
-    retention_days: int = Field(default=30, gt=0)
+    enabled: bool = True
+    log_all_operations: bool = True
+    retention_days: PositiveInt = 30
 
 
-class SecurityConfig(BaseModel):
+@dataclass
+class SecurityConfig:
     """Security configuration."""
-    enabled: bool = Field(default=True)
-    authentication: AuthenticationConfig = Field(default_factory=AuthenticationConfig)
-    authorization: AuthorizationConfig = Field(default_factory=AuthorizationConfig)
-    audit: AuditConfig = Field(default_factory=AuditConfig)
+    enabled: bool = True
+    authentication: AuthenticationConfig = field(default_factory=AuthenticationConfig)
+    authorization: AuthorizationConfig = field(default_factory=AuthorizationConfig)
+    audit: AuditConfig = field(default_factory=AuditConfig)
 
 
-class ImageRecognitionConfig(BaseModel):
+@dataclass
+class ImageRecognitionConfig:
     """Image recognition configuration."""
-    enabled: bool = Field(default=True)
-    confidence_threshold: float = Field(default=0.8, ge=0.0, le=1.0)
+    enabled: bool = True
+    confidence_threshold: Annotated[float, Ge(0.0), Le(1.0)] = 0.8
 
 
-class GuiAutomationConfig(BaseModel):
+@dataclass
+class GuiAutomationConfig:
     """GUI automation configuration."""
-    enabled: bool = Field(default=True)
-    safe_mode: bool = Field(default=True)
-    failsafe: bool = Field(default=True)
-    min_delay: float = Field(default=0.1, ge=0.0)
-    max_screen_resolution: List[int] = Field(default=[1920, 1080])
-    screenshot_directory: str = Field(default="~/.pc_control_mcp/screenshots")
-    image_recognition: ImageRecognitionConfig = Field(default_factory=ImageRecognitionConfig)
+    enabled: bool = True
+    safe_mode: bool = True
+    failsafe: bool = True
+    min_delay: Annotated[float, Ge(0.0)] = 0.1
+    max_screen_resolution: List[int] = field(default_factory=lambda: [1920, 1080])
+    screenshot_directory: str = "~/.pc_control_mcp/screenshots"
+    image_recognition: ImageRecognitionConfig = field(default_factory=ImageRecognitionConfig)
     
-    @field_validator('screenshot_directory')
-    @classmethod
-    def expand_screenshot_directory(cls, v):
-        return str(Path(v).expanduser())
+    def __post_init__(self):
+        self.screenshot_directory = str(Path(self.screenshot_directory).expanduser())
 
 
-class MetricsConfig(BaseModel):
+@dataclass
+class MetricsConfig:
     """Metrics configuration."""
-    cpu_threshold: int = Field(default=80, ge=0, le=100)
-    memory_threshold: int = Field(default=90, ge=0, le=100)
-    disk_threshold: int = Field(default=85, ge=0, le=100)
+    cpu_threshold: Percent = 80
+    memory_threshold: Percent = 90
+    disk_threshold: Percent = 85
 
 
-class AlertsConfig(BaseModel):
+@dataclass
+class AlertsConfig:
     """Alerts configuration."""
-    enabled: bool = Field(default=True)
-    email: bool = Field(default=False)
-    webhook: bool = Field(default=False)
-    log: bool = Field(default=True)
+    enabled: bool = True
+    email: bool = False
+    webhook: bool = False
+    log: bool = True
 
 
-class MonitoringConfig(BaseModel):
+@dataclass
+class MonitoringConfig:
     """Monitoring configuration."""
-    enabled: bool = Field(default=True)
-    interval: int = Field(default=5, gt=0)
-    metrics: MetricsConfig = Field(default_factory=MetricsConfig)
-    alerts: AlertsConfig = Field(default_factory=AlertsConfig)
+    enabled: bool = True
+    interval: PositiveInt = 5
+    metrics: MetricsConfig = field(default_factory=MetricsConfig)
+    alerts: AlertsConfig = field(default_factory=AlertsConfig)
 
 
-class ResourceLimitsConfig(BaseModel):
+@dataclass
+class ResourceLimitsConfig:
     """Resource limits configuration."""
-    cpu_percent: int = Field(default=100, ge=0, le=100)
-    memory_mb: int = Field(default=1024, gt=0)
+    cpu_percent: Percent = 100
+    memory_mb: PositiveInt = 1024
 
 
-class ProcessManagementConfig(BaseModel):
+@dataclass
+class ProcessManagementConfig:
     """Process management configuration."""
-    max_processes: int = Field(default=100, gt=0)
-    allowed_processes: List[str] = Field(default_factory=list)
-    blocked_processes: List[str] = Field(default_factory=list)
-    resource_limits: ResourceLimitsConfig = Field(default_factory=ResourceLimitsConfig)
+    max_processes: PositiveInt = 100
+    allowed_processes: List[str] = field(default_factory=list)
+    blocked_processes: List[str] = field(default_factory=list)
+    resource_limits: ResourceLimitsConfig = field(default_factory=ResourceLimitsConfig)
 
 
-class NetworkConfig(BaseModel):
+@dataclass
+class NetworkConfig:
     """Network configuration."""
-    allowed_ports: List[int] = Field(default_factory=list)
-    blocked_ports: List[int] = Field(default_factory=list)
-    interface_monitoring: bool = Field(default=True)
-    traffic_analysis: bool = Field(default=False)
+    allowed_ports: List[int] = field(default_factory=list)
+    blocked_ports: List[int] = field(default_factory=list)
+    interface_monitoring: bool = True
+    traffic_analysis: bool = False
 
 
-class FileOperationsConfig(BaseModel):
+@dataclass
+class FileOperationsConfig:
     """File operations configuration."""
-    allowed_paths: List[str] = Field(default_factory=list)
-    blocked_paths: List[str] = Field(default_factory=lambda: [
+    allowed_paths: List[str] = field(default_factory=list)
+    blocked_paths: List[str] = field(default_factory=lambda: [
         "/etc", "/sys", "/proc", 
         "C:\\Windows\\System32", "C:\\Program Files"
     ])
-    max_file_size: int = Field(default=104857600, gt=0)  # 100MB
-    allowed_extensions: List[str] = Field(default_factory=list)
-    blocked_extensions: List[str] = Field(default_factory=lambda: [
+    max_file_size: PositiveInt = 104857600  # 100MB
+    allowed_extensions: List[str] = field(default_factory=list)
+    blocked_extensions: List[str] = field(default_factory=lambda: [
         ".exe", ".dll", ".sys", ".bat", ".cmd"
     ])
 
 
-class ServerConfig(BaseModel):
+@dataclass
+class ServerConfig:
     """Server configuration."""
-    name: str = Field(default="pc-control-mcp")
-    version: str = Field(default="2.0.0")
-    log_level: str = Field(default="INFO", pattern="^(DEBUG|INFO|WARNING|ERROR|CRITICAL)$")
-    max_connections: int = Field(default=10, gt=0)
-    pretty_json: bool = Field(default=False)
+    name: str = "pc-control-mcp"
+    version: str = "2.0.0"
+    log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = "INFO"
+    max_connections: PositiveInt = 10
+    pretty_json: bool = False
 
 
-class Config(BaseModel):
+@dataclass
+class Config:
     """Main configuration model."""
-    server: ServerConfig = Field(default_factory=ServerConfig)
-    security: SecurityConfig = Field(default_factory=SecurityConfig)
-    gui_automation: GuiAutomationConfig = Field(default_factory=GuiAutomationConfig)
-    monitoring: MonitoringConfig = Field(default_factory=MonitoringConfig)
-    process_management: ProcessManagementConfig = Field(default_factory=ProcessManagementConfig)
-    network: NetworkConfig = Field(default_factory=NetworkConfig)
-    file_operations: FileOperationsConfig = Field(default_factory=FileOperationsConfig)
+    server: ServerConfig = field(default_factory=ServerConfig)
+    security: SecurityConfig = field(default_factory=SecurityConfig)
+    gui_automation: GuiAutomationConfig = field(default_factory=GuiAutomationConfig)
+    monitoring: MonitoringConfig = field(default_factory=MonitoringConfig)
+    process_management: ProcessManagementConfig = field(default_factory=ProcessManagementConfig)
+    network: NetworkConfig = field(default_factory=NetworkConfig)
+    file_operations: FileOperationsConfig = field(default_factory=FileOperationsConfig)
+
+
+_config_adapter = None
+
+def _to_bool(value: str) -> bool:
+    """Parse a boolean environment variable."""
+    return value.lower() in ('true', '1', 'yes', 'on')
+
+
+# Environment variable -> (config path, value parser)
+_ENV_PREFIX = 'PC_CONTROL_'
+_ENV_OVERRIDES = {
+    'PC_CONTROL_LOG_LEVEL': (('server', 'log_level'), str),
+    'PC_CONTROL_MAX_CONNECTIONS': (('server', 'max_connections'), int),
+    'PC_CONTROL_SECURITY_ENABLED': (('security', 'enabled'), _to_bool),
+    'PC_CONTROL_AUTH_TYPE': (('security', 'authentication', 'type'), str),
+    'PC_CONTROL_GUI_ENABLED': (('gui_automation', 'enabled'), _to_bool),
+    'PC_CONTROL_MONITORING_ENABLED': (('monitoring', 'enabled'), _to_bool),
+}
+
+# .env is read once per process, not on every reload()
+_dotenv_loaded = False
+
+# Sentinels for ConfigManager.get: not cached yet / path does not exist
+_MISSING = object()
+_MISSING_PATH = object()
+
+
+def _get_config_adapter():
+    """Return the pydantic TypeAdapter for Config, built on first use."""
+    global _config_adapter
+    if _config_adapter is None:
+        from pydantic import TypeAdapter
+        _config_adapter = TypeAdapter(Config)
+    return _config_adapter
+
+
+def _find_default_config_path() -> Optional[Path]:
+    """Return the first existing default configuration file, if any."""
+    default_paths = [
+        Path("config/default.yaml"),
+        Path(__file__).parent.parent.parent / "config" / "default.yaml",
+        Path.home() / ".pc_control_mcp" / "config.yaml"
+    ]
+    
+    for path in default_paths:
+        try:
+            path.stat()
+        except OSError:
+            continue
+        # Absolute, so the cached result survives a later chdir
+        return path.resolve()
+    return None
+
+
+# Default config file location, resolved on first use
+_default_config_path: Any = _MISSING
+
+
+def _clear_default_config_path():
+    """Forget the cached default configuration file location."""
+    global _default_config_path
+    _default_config_path = _MISSING
 
 
 class ConfigManager:
@@ -153,12 +239,18 @@ class ConfigManager:
         
         Args:
             config_path: Path to configuration file. If not provided,
-                        will look for config/default.yaml
+                        uses $PC_CONTROL_CONFIG_PATH or looks for
+                        config/default.yaml
         """
         log.debug("ConfigManager.__init__", config_path=str(config_path))
         self.config_path = self._resolve_config_path(config_path)
         log.debug("Resolved config path", path=str(self.config_path))
-        self.config = self._load_config()
+        self._get_cache: Dict[str, Any] = {}
+        self._config_mtime: Optional[int] = None
+        # Parsed and validated file contents, reused by reload() while the
+        # file is unchanged; self.config is a working copy of it
+        self._file_config = self._load_config()
+        self.config = copy.deepcopy(self._file_config)
         log.debug("Loaded config")
         self._apply_env_overrides()
         log.debug("Applied env overrides")
@@ -177,35 +269,44 @@ class ConfigManager:
     def _resolve_config_path(self, config_path: Optional[Union[str, Path]]) -> Path:
         """Resolve configuration file path."""
         if config_path:
+            # An explicit file replaces the default search; drop its cache
+            _clear_default_config_path()
             path = Path(config_path)
             if path.exists():
-                return path
+                return path.resolve()
             else:
                 raise ConfigurationException(f"Configuration file not found: {path}")
         
-        # Look for default configuration
-        default_paths = [
-            Path("config/default.yaml"),
-            Path(__file__).parent.parent.parent / "config" / "default.yaml",
-            Path.home() / ".pc_control_mcp" / "config.yaml"
-        ]
+        # Explicit override from the environment skips the search
+        env_path = os.getenv('PC_CONTROL_CONFIG_PATH')
+        if env_path:
+            return self._resolve_config_path(env_path)
         
-        for path in default_paths:
-            if path.exists():
-                log.info(f"Using configuration file: {path}")
-                return path
-        
-        # No configuration file found, will use defaults
-        log.warning("No configuration file found, using defaults")
-        return None
+        # Look for default configuration (resolved once per process)
+        global _default_config_path
+        if _default_config_path is _MISSING:
+            _default_config_path = _find_default_config_path()
+            if _default_config_path:
+                log.info(f"Using configuration file: {_default_config_path}")
+            else:
+                # No configuration file found, will use defaults
+                log.warning("No configuration file found, using defaults")
+        return _default_config_path
     
     def _load_config(self) -> Config:
         """Load configuration from file."""
         if self.config_path:
+            import yaml
+            from pydantic import ValidationError
+            try:
+                from yaml import CSafeLoader as SafeLoader  # libyaml
+            except ImportError:
+                from yaml import SafeLoader
             try:
                 with open(self.config_path, 'r') as f:
-                    config_data = yaml.safe_load(f)
-                    return Config(**config_data)
+                    self._config_mtime = os.fstat(f.fileno()).st_mtime_ns
+                    config_data = yaml.load(f, Loader=SafeLoader)
+                return _get_config_adapter().validate_python(config_data or {})
             except (yaml.YAMLError, ValidationError) as e:
                 raise ConfigurationException(f"Failed to load configuration: {e}")
         else:
@@ -214,49 +315,29 @@ class ConfigManager:
     
     def _apply_env_overrides(self):
         """Apply environment variable overrides."""
-        load_dotenv()
-        
-        # Override configuration with environment variables
-        env_mappings = {
-            'PC_CONTROL_LOG_LEVEL': ('server', 'log_level'),
-            'PC_CONTROL_MAX_CONNECTIONS': ('server', 'max_connections'),
-            'PC_CONTROL_SECURITY_ENABLED': ('security', 'enabled'),
-            'PC_CONTROL_AUTH_TYPE': ('security', 'authentication', 'type'),
-            'PC_CONTROL_GUI_ENABLED': ('gui_automation', 'enabled'),
-            'PC_CONTROL_MONITORING_ENABLED': ('monitoring', 'enabled'),
-        }
+        global _dotenv_loaded
+        if not _dotenv_loaded:
+            from dotenv import load_dotenv
+            load_dotenv()
+            _dotenv_loaded = True
         
-        for env_var, config_path in env_mappings.items():
-            value = os.getenv(env_var)
+        # Override configuration with environment variables (one environ scan)
+        present = {k: v for k, v in os.environ.items() if k.startswith(_ENV_PREFIX)}
+        if not present:
+            return
+        for env_var, (config_path, caster) in _ENV_OVERRIDES.items():
+            value = present.get(env_var)
             if value is not None:
-                self._set_config_value(config_path, value)
+                self._set_config_value(config_path, caster(value))
     
-    def _set_config_value(self, path: tuple, value: str):
+    def _set_config_value(self, path: tuple, value: Any):
         """Set configuration value by path."""
         obj = self.config
         for key in path[:-1]:
             obj = getattr(obj, key)
         
-        # Convert value to appropriate type (support Pydantic v2)
-        try:
-            field_info = obj.model_fields[path[-1]]  # type: ignore[attr-defined]
-            py_type = field_info.annotation  # type: ignore[attr-defined]
-        except Exception:
-            # Fallback to v1 API
-            try:
-                field_info = obj.__fields__[path[-1]]  # type: ignore[attr-defined]
-                py_type = getattr(field_info, 'type_', None)
-            except Exception:
-                py_type = None
-
-        if py_type in (bool, 'bool'):
-            value = str(value).lower() in ('true', '1', 'yes', 'on')
-        elif py_type in (int, 'int'):
-            value = int(value)
-        elif py_type in (float, 'float'):
-            value = float(value)
-        
         setattr(obj, path[-1], value)
+        self._get_cache.clear()
         log.info(f"Configuration override: {'.'.join(path)} = {value}")
     
     def get(self, path: str, default: Any = None) -> Any:
@@ -269,18 +350,42 @@ class ConfigManager:
         Returns:
             Configuration value
         """
-        try:
-            obj = self.config
-            for key in path.split('.'):
-                obj = getattr(obj, key)
-            return obj
-        except AttributeError:
+        value = self._get_cache.get(path, _MISSING)
+        if value is _MISSING:
+            try:
+                value = self.config
+                for key in path.split('.'):
+                    value = getattr(value, key)
+            except AttributeError:
+                # Cache misses too, so unknown paths don't re-walk the tree
+                value = _MISSING_PATH
+            self._get_cache[path] = value
+        if value is _MISSING_PATH:
             return default
+        return value
     
     def reload(self):
-        """Reload configuration from file."""
-        log.info("Reloading configuration")
-        self.config = self._load_config()
+        """Reload configuration from file.
+        
+        The configuration is always rebuilt from the file contents, which
+        discards runtime edits, and environment overrides are re-applied.
+        Only parsing and validating the file are skipped when it has not
+        been modified since it was last loaded.
+        """
+        unchanged = False
+        if self.config_path and self._config_mtime is not None:
+            try:
+                unchanged = self.config_path.stat().st_mtime_ns == self._config_mtime
+            except OSError:
+                pass
+        
+        if unchanged:
+            log.debug("Configuration file unchanged, reusing parsed contents")
+        else:
+            log.info("Reloading configuration")
+            self._file_config = self._load_config()
+        self._get_cache.clear()
+        self.config = copy.deepcopy(self._file_config)
         self._apply_env_overrides()
     
     def validate(self) -> bool:
@@ -289,9 +394,10 @@ class ConfigManager:
         Returns:
             True if configuration is valid
         """
+        from pydantic import ValidationError
+        
         try:
-            # Pydantic handles validation automatically
-            self.config.dict()
+            _get_config_adapter().validate_python(self.to_dict())
             return True
         except ValidationError as e:
             log.error(f"Configuration validation failed: {e}")
@@ -303,7 +409,7 @@ class ConfigManager:
         Returns:
             Configuration as dictionary
         """
-        return self.config.dict()
+        return asdict(self.config)
     
     def save(self, path: Optional[Union[str, Path]] = None):
         """Save current configuration to file.
@@ -316,11 +422,24 @@ class ConfigManager:
         if not save_path:
             raise ConfigurationException("No path specified for saving configuration")
         
+        import yaml
+        try:
+            from yaml import CSafeDumper as SafeDumper  # libyaml
+        except ImportError:
+            from yaml import SafeDumper
+        
         save_path = Path(save_path)
         save_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(save_path, 'w') as f:
-            yaml.dump(self.to_dict(), f, default_flow_style=False)
+        # Write to a sibling temp file and swap it in atomically
+        tmp_path = save_path.with_name(save_path.name + '.tmp')
+        try:
+            with open(tmp_path, 'w') as f:
+                yaml.dump(self.to_dict(), f, Dumper=SafeDumper, default_flow_style=False)
+            os.replace(tmp_path, save_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
         
         log.info(f"Configuration saved to: {save_path}")
 
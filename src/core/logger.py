@@ -2,6 +2,7 @@
 Logging configuration and utilities for PC Control MCP Server.
 """
 
+import re
 import sys
 import json
 from pathlib import Path
@@ -9,11 +10,28 @@ from typing import Optional, Dict, Any, Union
 from datetime import datetime, timezone
 import traceback
 
-from loguru import logger
-import yaml
-
 from .exceptions import ConfigurationException
 
+try:
+    import orjson
+    
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+except ImportError:
+    def _json_default(obj: Any) -> str:
+        return obj.isoformat() if isinstance(obj, datetime) else str(obj)
+    
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, default=_json_default)
+
+# Lowest level any StructuredLogger sink accepts; calls below it return
+# before building extra fields. 0 until logging is configured.
+_min_level_no = 0
+_DEBUG, _INFO, _WARNING, _ERROR, _CRITICAL = 10, 20, 30, 40, 50
+
+# Keys whose values are masked in audit entries
+_SENSITIVE_KEY_RE = re.compile(r'password|token|api_key|secret|credential', re.IGNORECASE)
+
 
 class LoggerConfig:
     """Logger configuration management."""
@@ -26,8 +44,13 @@ class LoggerConfig:
     def _load_config(self) -> Dict[str, Any]:
         """Load logger configuration from file or use defaults."""
         if self.config_path and Path(self.config_path).exists():
+            import yaml
+            try:
+                from yaml import CSafeLoader as SafeLoader  # libyaml
+            except ImportError:
+                from yaml import SafeLoader
             with open(self.config_path, 'r') as f:
-                return yaml.safe_load(f)
+                return yaml.load(f, Loader=SafeLoader)
         
         # Default configuration
         return {
@@ -39,6 +62,8 @@ class LoggerConfig:
     
     def _setup_logger(self):
         """Configure loguru logger."""
+        from loguru import logger
+        
         # Remove default handler
         logger.remove()
         
@@ -47,6 +72,9 @@ class LoggerConfig:
         log_format = self.config.get('server', {}).get('log_format', 
             '{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message} | {extra}')
         
+        global _min_level_no
+        _min_level_no = logger.level(log_level).no
+        
         # Console handler
         logger.add(
             sys.stderr,
@@ -91,6 +119,7 @@ class AuditLogger:
     """Specialized audit logger for security events."""
     
     def __init__(self):
+        from loguru import logger
         self.logger = logger.bind(audit=True)
     
     def log_operation(self, 
@@ -103,7 +132,7 @@ class AuditLogger:
                      user_agent: Optional[str] = None):
         """Log an auditable operation."""
         audit_entry = {
-            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'timestamp': datetime.now(timezone.utc),
             'user_id': user_id or 'anonymous',
             'action': action,
             'resource': resource,
@@ -116,48 +145,89 @@ class AuditLogger:
         # Mask sensitive data
         audit_entry = self._mask_sensitive_data(audit_entry)
         
-        self.logger.info(f"AUDIT: {json.dumps(audit_entry)}")
+        self.logger.info(f"AUDIT: {_dumps(audit_entry)}")
     
     def _mask_sensitive_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Mask sensitive data in audit logs."""
-        sensitive_fields = ['password', 'token', 'api_key', 'secret', 'credential']
+        """Mask sensitive data in audit logs.
         
-        def mask_dict(d: Dict[str, Any]) -> Dict[str, Any]:
-            masked = {}
-            for key, value in d.items():
-                if any(field in key.lower() for field in sensitive_fields):
-                    masked[key] = '***MASKED***'
+        Walks nested dicts (and dicts inside lists) iteratively, building a
+        masked copy with the same shape.
+        """
+        masked_root: Dict[str, Any] = {}
+        stack = [(data, masked_root)]
+        
+        while stack:
+            source, target = stack.pop()
+            for key, value in source.items():
+                if isinstance(key, str) and _SENSITIVE_KEY_RE.search(key):
+                    target[key] = '***MASKED***'
                 elif isinstance(value, dict):
-                    masked[key] = mask_dict(value)
+                    child: Dict[str, Any] = {}
+                    target[key] = child
+                    stack.append((value, child))
                 elif isinstance(value, list):
-                    masked[key] = [mask_dict(item) if isinstance(item, dict) else item for item in value]
+                    items = []
+                    for item in value:
+                        if isinstance(item, dict):
+                            child = {}
+                            stack.append((item, child))
+                            item = child
+                        items.append(item)
+                    target[key] = items
                 else:
-                    masked[key] = value
-            return masked
+                    target[key] = value
         
-        return mask_dict(data)
+        return masked_root
 
 
 class StructuredLogger:
-    """Structured logging wrapper for consistent log format."""
+    """Structured logging wrapper for consistent log format.
+    
+    Instances are shared per name: StructuredLogger(__name__) returns the
+    same object every time it is called for a module.
+    """
+    
+    _instances: Dict[str, 'StructuredLogger'] = {}
     
-    def __init__(self, name: str):
-        self.logger = logger.bind(name=name)
+    def __new__(cls, name: str):
+        instance = cls._instances.get(name)
+        if instance is None:
+            instance = super().__new__(cls)
+            instance.name = name
+            instance._logger = None
+            cls._instances[name] = instance
+        return instance
+    
+    @property
+    def logger(self):
+        """Bound loguru logger, created on first use."""
+        if self._logger is None:
+            from loguru import logger
+            self._logger = logger.bind(name=self.name)
+        return self._logger
     
     def debug(self, message: str, **kwargs):
         """Log debug message with structured data."""
+        if _DEBUG < _min_level_no:
+            return
         self.logger.debug(message, **self._prepare_extra(kwargs))
     
     def info(self, message: str, **kwargs):
         """Log info message with structured data."""
+        if _INFO < _min_level_no:
+            return
         self.logger.info(message, **self._prepare_extra(kwargs))
     
     def warning(self, message: str, **kwargs):
         """Log warning message with structured data."""
+        if _WARNING < _min_level_no:
+            return
         self.logger.warning(message, **self._prepare_extra(kwargs))
     
     def error(self, message: str, exception: Optional[Exception] = None, **kwargs):
         """Log error message with structured data."""
+        if _ERROR < _min_level_no:
+            return
         extra = self._prepare_extra(kwargs)
         if exception:
             extra['exception_type'] = type(exception).__name__
@@ -167,6 +237,8 @@ class StructuredLogger:
     
     def critical(self, message: str, exception: Optional[Exception] = None, **kwargs):
         """Log critical message with structured data."""
+        if _CRITICAL < _min_level_no:
+            return
         extra = self._prepare_extra(kwargs)
         if exception:
             extra['exception_type'] = type(exception).__name__
@@ -176,6 +248,8 @@ class StructuredLogger:
     
     def _prepare_extra(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Prepare extra data for logging."""
+        if not data:
+            return data
         return {k: v for k, v in data.items() if v is not None}
 
 
@@ -192,6 +266,8 @@ def enable_test_logging(project_root: Optional[Union[str, Path]] = None,
     Adds an extra sink into the project `logs/` directory with a unique filename
     so it is easy to attach to bug reports. Returns the path to the log file.
     """
+    from loguru import logger
+    
     root = Path(project_root) if project_root else Path.cwd()
     logs_dir = root / 'logs'
     logs_dir.mkdir(parents=True, exist_ok=True)
@@ -216,8 +292,6 @@ def enable_test_logging(project_root: Optional[Union[str, Path]] = None,
     )
     # Lower global level to DEBUG for tests
     logger.level(level)
-    return log_path
-
-
-# Create module logger
-log = StructuredLogger(__name__)
\ No newline at end of file
+    global _min_level_no
+    _min_level_no = min(_min_level_no, logger.level(level).no)
+    return log_path
\ No newline at end of file
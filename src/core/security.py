@@ -2,16 +2,35 @@
 Security management for PC Control MCP Server.
 """
 
+import os
 import re
+import asyncio
 import hashlib
 import secrets
 import time
+import threading
+from collections import defaultdict
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List, Tuple, Union, Callable
 from datetime import datetime, timedelta, timezone
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import jwt
 import bcrypt
+from cachetools import TTLCache
+
+try:
+    import argon2
+    ARGON2_AVAILABLE = True
+except ImportError:
+    ARGON2_AVAILABLE = False
+    argon2 = None
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    ahocorasick = None
 
 from .config import get_config, SecurityConfig
 from .logger import StructuredLogger, AuditLogger
@@ -26,6 +45,68 @@ from .exceptions import (
 log = StructuredLogger(__name__)
 
 
+# Command patterns rejected by InputValidator.validate_command
+_DANGEROUS_PATTERNS = (
+    r"rm\s+-rf\s+/",
+    r"format\s+[cC]:",
+    r"del\s+/[fF]\s+/[sS]\s+/[qQ]",
+    r"shutdown|poweroff|reboot",
+    r":(){ :|:& };:",  # Fork bomb
+    r"dd\s+if=/dev/zero",
+    r"mkfs\.",
+)
+# All patterns fused into one alternation; group p<i> identifies the match
+_DANGEROUS_COMMAND_RE = re.compile("|".join(
+    f"(?P<p{i}>{pattern})" for i, pattern in enumerate(_DANGEROUS_PATTERNS)
+))
+# Literals every branch of _DANGEROUS_PATTERNS requires (patterns are
+# case-sensitive on these); commands containing none of them skip the regex
+_DANGER_TOKENS = (
+    "rm", "format", "del", "shutdown", "poweroff", "reboot",
+    ":{ :", ":& };:", "dd", "mkfs.",
+)
+
+
+def _build_danger_matcher():
+    """Return a predicate telling whether a command contains any danger token.
+    
+    With pyahocorasick all tokens are matched in one automaton pass;
+    otherwise each token is tested with a substring search.
+    """
+    if AHOCORASICK_AVAILABLE:
+        automaton = ahocorasick.Automaton()
+        for index, token in enumerate(_DANGER_TOKENS):
+            automaton.add_word(token, index)
+        automaton.make_automaton()
+        return lambda command: next(automaton.iter(command), None) is not None
+    return lambda command: any(token in command for token in _DANGER_TOKENS)
+
+
+_has_danger_token = _build_danger_matcher()
+
+# Control characters stripped by sanitize_input (keeps \t, \n, \r)
+_CONTROL_CHARS_TABLE = dict.fromkeys(
+    [*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), 0x7F]
+)
+_PROCESS_NAME_RE = re.compile(r"^[a-zA-Z0-9\-_.]+$")
+# One scan for everything validate_path rejects besides length: a '..'
+# path segment or a null byte. Segments may also start right after a
+# drive ('C:..'), and trailing dots/spaces count as '..' because Windows
+# strips them ('.. ', '...'). Names merely containing '..' ('a..b') pass.
+_PATH_HAZARD_RE = re.compile(
+    r"(?P<traversal>(?:^[A-Za-z]:|^|[\\/])\.\.[. ]*(?=[\\/]|$))|(?P<null>\x00)"
+)
+
+
+# Token decoder with fixed verification options, built once
+_JWT_DECODER = jwt.PyJWT(options={
+    "verify_signature": True,
+    "verify_exp": True,
+    "require": ["exp", "iat", "user_id"],
+})
+_JWT_ALGORITHMS = ["HS256"]
+
+
 class User:
     """User representation."""
     
@@ -60,15 +141,19 @@ class Operation:
 
 
 class SessionManager:
-    """Session management."""
+    """Session management.
     
-    def __init__(self):
-        self.sessions: Dict[str, User] = {}
-        self.tokens: Dict[str, str] = {}  # token -> user_id
+    Sessions and tokens expire after ttl seconds and the stores are capped
+    at maxsize entries, so abandoned logins do not accumulate.
+    """
+    
+    def __init__(self, ttl: float = 3600, maxsize: int = 100_000):
+        self.sessions: Dict[str, User] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.tokens: Dict[str, str] = TTLCache(maxsize=maxsize, ttl=ttl)  # token -> user_id
         
     def create_session(self, user: User) -> str:
         """Create a new session."""
-        session_id = secrets.token_urlsafe(32)
+        session_id = secrets.token_hex(32)
         self.sessions[session_id] = user
         return session_id
     
@@ -82,7 +167,7 @@ class SessionManager:
     
     def create_token(self, user_id: str) -> str:
         """Create authentication token."""
-        token = secrets.token_urlsafe(32)
+        token = secrets.token_hex(32)
         self.tokens[token] = user_id
         return token
     
@@ -96,10 +181,33 @@ class SessionManager:
 
 
 class RateLimiter:
-    """Rate limiting implementation."""
+    """Rate limiting implementation (sliding window counter).
+    
+    Each identifier keeps only the request counts of the current and the
+    previous fixed window; the previous count is weighted by how much of
+    it still overlaps the sliding window.
+    
+    Counters are split over a fixed number of shards, each with its own
+    lock, so concurrent callers only serialize on the same shard.
+    """
     
-    def __init__(self):
-        self.requests: Dict[str, List[float]] = defaultdict(list)
+    SHARDS = 64  # power of two; shard = hash(identifier) & (SHARDS - 1)
+    
+    def __init__(self, max_identifiers: int = 10_000):
+        # Per shard: identifier -> [window index, current count, previous count]
+        self._shards = tuple(({}, threading.Lock()) for _ in range(self.SHARDS))
+        self.max_identifiers = max_identifiers
+        self._max_per_shard = max(1, max_identifiers // self.SHARDS)
+    
+    @staticmethod
+    def _prune_idle(counters: Dict[str, List[int]], current_window: int):
+        """Drop identifiers with no requests in the current or previous window."""
+        idle = [
+            identifier for identifier, (window, _, _) in counters.items()
+            if window < current_window - 1
+        ]
+        for identifier in idle:
+            del counters[identifier]
     
     def check_rate_limit(self, identifier: str, limit: int, 
                         window_seconds: int) -> Tuple[bool, Optional[int]]:
@@ -109,23 +217,39 @@ class RateLimiter:
             Tuple of (is_allowed, retry_after_seconds)
         """
         now = time.time()
-        window_start = now - window_seconds
-        
-        # Clean old requests
-        self.requests[identifier] = [
-            req_time for req_time in self.requests[identifier]
-            if req_time > window_start
-        ]
-        
-        # Check limit
-        if len(self.requests[identifier]) >= limit:
-            oldest_request = min(self.requests[identifier])
-            retry_after = int(oldest_request + window_seconds - now) + 1
-            return False, retry_after
-        
-        # Record request
-        self.requests[identifier].append(now)
-        return True, None
+        current_window = int(now // window_seconds)
+        elapsed = (now % window_seconds) / window_seconds
+        
+        counters, lock = self._shards[hash(identifier) & (self.SHARDS - 1)]
+        with lock:
+            counter = counters.get(identifier)
+            if counter is None:
+                # Keep the tracked identifier set bounded over the server lifetime
+                if len(counters) >= self._max_per_shard:
+                    self._prune_idle(counters, current_window)
+                counter = counters[identifier] = [current_window, 0, 0]
+            elif counter[0] != current_window:
+                # Roll the windows forward
+                previous = counter[1] if counter[0] == current_window - 1 else 0
+                counter[0], counter[1], counter[2] = current_window, 0, previous
+            
+            _, current, previous = counter
+            
+            # Check limit
+            if previous * (1 - elapsed) + current >= limit:
+                window_start = current_window * window_seconds
+                if current < limit:
+                    # Wait until enough of the previous window has slid out
+                    allowed_at = window_start + (1 - (limit - current) / previous) * window_seconds
+                else:
+                    # Full for the rest of this window, and in the next one
+                    # this window's count still weighs in as the previous
+                    allowed_at = window_start + (2 - limit / max(current, 1)) * window_seconds
+                return False, int(allowed_at - now) + 1
+            
+            # Record request
+            counter[1] += 1
+            return True, None
 
 
 class InputValidator:
@@ -144,21 +268,15 @@ class InputValidator:
             result["valid"] = False
             result["errors"].append("Command too long (max 1000 characters)")
         
-        # Check for dangerous patterns
-        dangerous_patterns = [
-            r"rm\s+-rf\s+/",
-            r"format\s+[cC]:",
-            r"del\s+/[fF]\s+/[sS]\s+/[qQ]",
-            r"shutdown|poweroff|reboot",
-            r":(){ :|:& };:",  # Fork bomb
-            r"dd\s+if=/dev/zero",
-            r"mkfs\.",
-        ]
-        
-        for pattern in dangerous_patterns:
-            if re.search(pattern, command):
-                result["valid"] = False
-                result["errors"].append(f"Dangerous command pattern detected: {pattern}")
+        # Check for dangerous patterns; the literal prefilter spares the
+        # regex for the common benign command
+        if not _has_danger_token(command):
+            return result
+        match = _DANGEROUS_COMMAND_RE.search(command)
+        if match:
+            pattern = _DANGEROUS_PATTERNS[int(match.lastgroup[1:])]
+            result["valid"] = False
+            result["errors"].append(f"Dangerous command pattern detected: {pattern}")
         
         return result
     
@@ -172,16 +290,15 @@ class InputValidator:
             result["valid"] = False
             result["errors"].append("Path too long (max 260 characters)")
         
-        # Check for path traversal
-        normalized_path = Path(path).resolve()
-        if ".." in str(path):
-            result["valid"] = False
-            result["errors"].append("Path traversal detected")
-        
-        # Check for null bytes
-        if "\x00" in path:
-            result["valid"] = False
-            result["errors"].append("Null byte in path")
+        # Traversal and null bytes in a single pass; clean paths stop here
+        if _PATH_HAZARD_RE.search(path):
+            found = {m.lastgroup for m in _PATH_HAZARD_RE.finditer(path)}
+            if "traversal" in found:
+                result["valid"] = False
+                result["errors"].append("Path traversal detected")
+            if "null" in found:
+                result["valid"] = False
+                result["errors"].append("Null byte in path")
         
         return result
     
@@ -196,7 +313,7 @@ class InputValidator:
             result["errors"].append("Process name too long (max 255 characters)")
         
         # Check allowed characters
-        if not re.match(r"^[a-zA-Z0-9\-_.]+$", name):
+        if not _PROCESS_NAME_RE.match(name):
             result["valid"] = False
             result["errors"].append("Invalid characters in process name")
         
@@ -205,11 +322,8 @@ class InputValidator:
     @staticmethod
     def sanitize_input(input_data: str) -> str:
         """Sanitize input data."""
-        # Remove null bytes
-        sanitized = input_data.replace("\x00", "")
-        
-        # Remove control characters (except newline, tab)
-        sanitized = re.sub(r"[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F]", "", sanitized)
+        # Remove null bytes and control characters (except newline, tab)
+        sanitized = input_data.translate(_CONTROL_CHARS_TABLE)
         
         # Trim whitespace
         sanitized = sanitized.strip()
@@ -217,16 +331,79 @@ class InputValidator:
         return sanitized
 
 
+class BcryptHasher:
+    """bcrypt password hashing (single-threaded per hash)."""
+    
+    def __init__(self, rounds: int = 12):
+        self.rounds = rounds
+    
+    def hash(self, password: bytes) -> str:
+        return bcrypt.hashpw(password, bcrypt.gensalt(self.rounds)).decode('utf-8')
+    
+    def verify(self, password: bytes, hashed: bytes) -> bool:
+        return bcrypt.checkpw(password, hashed)
+
+
+class Argon2Hasher:
+    """Argon2id password hashing; parallelism spreads one hash over several lanes."""
+    
+    def __init__(self, time_cost: int = 3, memory_cost: int = 64 << 10,
+                 parallelism: int = 4):
+        if not ARGON2_AVAILABLE:
+            raise SecurityException("argon2-cffi is required for argon2 password hashing")
+        self._hasher = argon2.PasswordHasher(
+            time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism
+        )
+    
+    def hash(self, password: bytes) -> str:
+        return self._hasher.hash(password)
+    
+    def verify(self, password: bytes, hashed: bytes) -> bool:
+        try:
+            return self._hasher.verify(hashed, password)
+        except (argon2.exceptions.VerificationError, argon2.exceptions.InvalidHashError):
+            return False
+
+
 class SecurityManager:
     """Main security manager."""
     
     def __init__(self, config: Optional[SecurityConfig] = None):
         self.config = config or get_config().config.security
-        self.session_manager = SessionManager()
+        self.session_manager = SessionManager(ttl=self.config.authentication.token_expiry)
         self.audit_logger = AuditLogger()
         self.rate_limiter = RateLimiter()
         self.validator = InputValidator(self.config)
-        self._jwt_secret = secrets.token_urlsafe(32)
+        self._jwt_secret = secrets.token_hex(32)
+        # Recently verified JWTs -> (user_id, roles, exp); skips HMAC re-verification
+        # on repeat calls. Kept per instance because the signing secret is.
+        self._jwt_cache: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+        # Revoked JWTs -> their exp (epoch seconds), checked before the cache
+        # and before decoding. Entries are dropped once the token has expired.
+        self._revoked_tokens: Dict[str, float] = {}
+        auth_config = self.config.authentication
+        self._bcrypt = BcryptHasher(rounds=auth_config.bcrypt_rounds)
+        self._hasher = (
+            Argon2Hasher(parallelism=auth_config.argon2_parallelism)
+            if auth_config.password_hash == "argon2" else self._bcrypt
+        )
+        # bcrypt releases the GIL; bound its parallelism to the core count
+        self._hash_executor = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 1, thread_name_prefix="pcmcp-bcrypt"
+        )
+        
+        # Path prefixes as tuples (longest first) for single startswith calls
+        self._blocked_prefixes = tuple(sorted(
+            self.config.authorization.blocked_paths, key=len, reverse=True
+        ))
+        self._allowed_prefixes = tuple(sorted(
+            self.config.authorization.__dict__.get("allowed_paths", []), key=len, reverse=True
+        ))
+        
+        # Authorization rules indexed by (resource, action), in declaration order
+        self._rule_index = self._build_rule_index(
+            self.config.authorization.__dict__.get("rules", [])
+        )
     
     async def authenticate(self, credentials: Dict[str, Any]) -> AuthResult:
         """Authenticate user."""
@@ -274,11 +451,27 @@ class SecurityManager:
         if not token:
             return AuthResult(success=False, error="Token required")
         
+        revoked_until = self._revoked_tokens.get(token)
+        if revoked_until is not None:
+            if revoked_until > time.time():
+                return AuthResult(success=False, error="Token revoked")
+            # Past its exp, so decoding rejects it as expired from here on
+            del self._revoked_tokens[token]
+        
+        cached = self._jwt_cache.get(token)
+        if cached is not None:
+            user_id, roles, exp = cached
+            if exp is None or exp > time.time():
+                return AuthResult(success=True, user=User(user_id, roles=list(roles)))
+            self._jwt_cache.pop(token, None)
+            return AuthResult(success=False, error="Token expired")
+        
         try:
             # Decode JWT token
-            payload = jwt.decode(token, self._jwt_secret, algorithms=["HS256"])
+            payload = _JWT_DECODER.decode(token, self._jwt_secret, algorithms=_JWT_ALGORITHMS)
             user_id = payload.get("user_id")
             roles = payload.get("roles", [])
+            self._jwt_cache[token] = (user_id, tuple(roles), payload.get("exp"))
             
             user = User(user_id, roles=roles)
             return AuthResult(success=True, user=user)
@@ -290,15 +483,36 @@ class SecurityManager:
     
     def create_token(self, user: User) -> str:
         """Create JWT token for user."""
+        now = datetime.now(timezone.utc)
         payload = {
             "user_id": user.user_id,
             "roles": user.roles,
-            "exp": datetime.now(timezone.utc) + timedelta(seconds=self.config.authentication.token_expiry),
-            "iat": datetime.now(timezone.utc)
+            "exp": now + timedelta(seconds=self.config.authentication.token_expiry),
+            "iat": now
         }
         
         return jwt.encode(payload, self._jwt_secret, algorithm="HS256")
     
+    def revoke_token(self, token: str):
+        """Revoke a token so it no longer authenticates.
+        
+        JWTs are self-contained, so they are kept on a denylist until their
+        own expiry; any cached verification is dropped as well.
+        """
+        self._jwt_cache.pop(token, None)
+        self.session_manager.revoke_token(token)
+        
+        now = time.time()
+        for expired in [t for t, exp in self._revoked_tokens.items() if exp <= now]:
+            del self._revoked_tokens[expired]
+        try:
+            exp = jwt.decode(token, options={"verify_signature": False}).get("exp")
+        except jwt.InvalidTokenError:
+            # Not a JWT (or malformed): it can never pass _authenticate_token
+            return
+        if isinstance(exp, (int, float)) and exp > now:
+            self._revoked_tokens[token] = exp
+    
     async def authorize(self, user: User, operation: Operation) -> bool:
         """Check if user is authorized for operation."""
         if not self.config.enabled:
@@ -308,42 +522,63 @@ class SecurityManager:
         if "admin" in user.roles:
             return True
         
-        # Check authorization rules
-        for rule in self.config.authorization.__dict__.get("rules", []):
-            if (rule.get("resource") == operation.resource and 
-                operation.action in rule.get("actions", [])):
-                
-                # Check conditions
-                if "conditions" in rule:
-                    if not self._check_conditions(rule["conditions"], operation):
-                        continue
-                
-                return rule.get("allow", False)
+        # Check authorization rules matching (resource, action)
+        for allow, checks in self._rule_index.get((operation.resource, operation.action), ()):
+            if checks and not self._check_conditions(checks, operation):
+                continue
+            return allow
         
         # Default deny
         return False
     
-    def _check_conditions(self, conditions: List[Dict], operation: Operation) -> bool:
-        """Check authorization conditions."""
-        for condition in conditions:
-            cond_type = condition.get("type")
-            cond_value = condition.get("value")
-            
-            if cond_type == "process_whitelist":
-                process_name = operation.details.get("process_name")
-                if process_name not in cond_value:
-                    return False
-            
-            elif cond_type == "path_whitelist":
-                path = operation.details.get("path")
-                if not any(path.startswith(allowed) for allowed in cond_value):
-                    return False
+    @classmethod
+    def _build_rule_index(cls, rules: List[Dict]) -> Dict[Tuple[str, str], List[Tuple[bool, List[Callable]]]]:
+        """Explode rules into a (resource, action) -> [(allow, checks)] index.
+        
+        Each rule's conditions are compiled to predicates once here, so
+        authorize never re-interprets the condition dicts.
+        """
+        index = defaultdict(list)
+        for rule in rules:
+            checks = [
+                check for check in map(cls._compile_condition, rule.get("conditions", ()))
+                if check is not None
+            ]
+            entry = (rule.get("allow", False), checks)
+            for action in rule.get("actions", []):
+                index[(rule.get("resource"), action)].append(entry)
+        return dict(index)
+    
+    @staticmethod
+    def _compile_condition(condition: Dict) -> Optional[Callable[[Operation], bool]]:
+        """Compile one rule condition into a predicate over an Operation.
+        
+        Unknown condition types return None and are ignored.
+        """
+        cond_type = condition.get("type")
+        cond_value = condition.get("value")
+        
+        if cond_type == "process_whitelist":
+            allowed = frozenset(cond_value or ())
+            return lambda op: op.details.get("process_name") in allowed
+        
+        if cond_type == "path_whitelist":
+            prefixes = tuple(cond_value or ())
             
-            elif cond_type == "safe_mode":
-                if operation.details.get("safe_mode") != cond_value:
-                    return False
+            def check_path(op: Operation) -> bool:
+                path = op.details.get("path")
+                return path is not None and path.startswith(prefixes)
+            return check_path
         
-        return True
+        if cond_type == "safe_mode":
+            return lambda op: op.details.get("safe_mode") == cond_value
+        
+        return None
+    
+    @staticmethod
+    def _check_conditions(checks: List[Callable[[Operation], bool]], operation: Operation) -> bool:
+        """Check compiled authorization conditions."""
+        return all(check(operation) for check in checks)
     
     async def audit_operation(self, user: User, operation: Operation, 
                             result: Any, success: bool = True):
@@ -405,31 +640,51 @@ class SecurityManager:
     
     def check_path_access(self, path: str, operation: str = "read") -> bool:
         """Check if path access is allowed."""
-        path = Path(path).resolve()
-        str_path = str(path)
+        # Resolved fresh on every call: symlink targets and the cwd can
+        # change between checks, so a cached result could be stale
+        path = str(Path(path).resolve())
         
         # Check blocked paths
-        blocked_paths = self.config.authorization.blocked_paths
-        for blocked in blocked_paths:
-            if str_path.startswith(blocked):
-                log.warning(f"Access denied to blocked path: {path}")
-                return False
+        if self._blocked_prefixes and path.startswith(self._blocked_prefixes):
+            log.warning(f"Access denied to blocked path: {path}")
+            return False
         
         # Check allowed paths (if configured)
-        allowed_paths = self.config.authorization.__dict__.get("allowed_paths", [])
-        if allowed_paths:
-            allowed = any(str_path.startswith(allowed) for allowed in allowed_paths)
-            if not allowed:
-                log.warning(f"Access denied to non-allowed path: {path}")
-                return False
+        if self._allowed_prefixes and not path.startswith(self._allowed_prefixes):
+            log.warning(f"Access denied to non-allowed path: {path}")
+            return False
         
         return True
     
-    def hash_password(self, password: str) -> str:
-        """Hash password using bcrypt."""
-        salt = bcrypt.gensalt()
-        return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+    def close(self):
+        """Shut down the password-hashing pool."""
+        self._hash_executor.shutdown(wait=False)
+    
+    async def _run_hash(self, func, *args):
+        """Run a blocking password-hash call on the hashing pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._hash_executor, func, *args)
     
-    def verify_password(self, password: str, hashed: str) -> bool:
-        """Verify password against hash."""
-        return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
\ No newline at end of file
+    async def hash_password(self, password: Union[str, bytes]) -> str:
+        """Hash password with the configured algorithm (bcrypt or argon2).
+        
+        Bytes are passed through as-is; str is encoded as UTF-8.
+        """
+        if isinstance(password, str):
+            password = password.encode('utf-8')
+        return await self._run_hash(self._hasher.hash, password)
+    
+    async def verify_password(self, password: Union[str, bytes],
+                              hashed: Union[str, bytes]) -> bool:
+        """Verify password against hash.
+        
+        The algorithm is taken from the hash itself, so bcrypt hashes keep
+        verifying after switching new passwords to argon2. Bytes are passed
+        through as-is; str is encoded as UTF-8.
+        """
+        if isinstance(password, str):
+            password = password.encode('utf-8')
+        if isinstance(hashed, str):
+            hashed = hashed.encode('utf-8')
+        hasher = self._hasher if hashed.startswith(b"$argon2") else self._bcrypt
+        return await self._run_hash(hasher.verify, password, hashed)
\ No newline at end of file
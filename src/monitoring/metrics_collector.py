@@ -3,10 +3,13 @@ Metrics collection for PC Control MCP Server.
 """
 
 import asyncio
+import itertools
+import operator
 import time
-from typing import Dict, Any, List, Optional, Callable
-from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, Callable, Tuple
+from datetime import datetime, timedelta, timezone
 from collections import deque, defaultdict
+import numpy as np
 import psutil
 
 from ..core import (
@@ -14,9 +17,46 @@ from ..core import (
     get_config,
     MonitoringException
 )
+from ..utils.platform_utils import get_cpu_percent
 
 log = StructuredLogger(__name__)
 
+# Default metrics produced by MetricsCollector._collect_system_snapshot
+_SNAPSHOT_METRICS = (
+    'cpu.percent',
+    'cpu.count',
+    'memory.percent',
+    'memory.used',
+    'memory.available',
+    'disk.usage_percent',
+    'network.bytes_sent',
+    'network.bytes_recv',
+    'process.count',
+)
+
+# AlertRule condition name -> comparison(value, threshold)
+_ALERT_COMPARATORS = {
+    'gt': operator.gt,
+    'lt': operator.lt,
+    'gte': operator.ge,
+    'lte': operator.le,
+    'eq': operator.eq,
+}
+
+# Vectorised counterparts used by AlertManager to test many thresholds at once
+_ALERT_UFUNCS = {
+    'gt': np.greater,
+    'lt': np.less,
+    'gte': np.greater_equal,
+    'lte': np.less_equal,
+    'eq': np.equal,
+}
+
+
+def _run_timed(func: Callable) -> Tuple[float, Any]:
+    """Run func, returning the monotonic time it started along with its result."""
+    return time.monotonic(), func()
+
 
 class MetricPoint:
     """Single metric data point."""
@@ -26,48 +66,124 @@ class MetricPoint:
         self.timestamp = timestamp or time.time()
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
+        """Convert to dictionary ('datetime' is ISO 8601 UTC with a +00:00 offset)."""
         return {
             'value': self.value,
             'timestamp': self.timestamp,
-            'datetime': datetime.fromtimestamp(self.timestamp).isoformat()
+            'datetime': datetime.fromtimestamp(self.timestamp, timezone.utc).isoformat(timespec='microseconds')
         }
 
 
 class Metric:
-    """Metric with history."""
+    """Metric with history.
+    
+    Points are kept in two preallocated NumPy ring buffers (values and
+    timestamps); MetricPoint objects are only built when history is read.
+    Sum, min and max over the whole buffer are maintained as points are
+    added and evicted, so whole-history stats need no pass over the data.
+    
+    Timestamps are stored on the monotonic clock so windows are unaffected
+    by wall-clock jumps; they are shifted to epoch seconds when read.
+    """
     
     def __init__(self, name: str, max_history: int = 1000):
         self.name = name
         self.max_history = max_history
-        self.history = deque(maxlen=max_history)
+        self._values = np.empty(max_history, dtype=np.float64)
+        self._timestamps = np.empty(max_history, dtype=np.float64)  # monotonic
+        self._epoch_offset = time.time() - time.monotonic()
+        self._head = 0  # next slot to write
+        self._size = 0
+        # Running aggregates over the buffered points
+        self._sum = 0.0
+        self._min = float('inf')
+        self._max = float('-inf')
+        self._extrema_stale = False  # an evicted point was the min or max
         self.current_value = None
         self.last_update = None
     
     def add_point(self, value: float, timestamp: Optional[float] = None):
-        """Add a data point."""
-        point = MetricPoint(value, timestamp)
-        self.history.append(point)
+        """Add a data point (timestamp, if given, is in epoch seconds)."""
+        if timestamp:
+            monotonic = timestamp - self._epoch_offset
+        else:
+            monotonic = time.monotonic()
+        head = self._head
+        
+        if self._size == self.max_history:
+            evicted = float(self._values[head])
+            self._sum -= evicted
+            if evicted <= self._min or evicted >= self._max:
+                self._extrema_stale = True
+        else:
+            self._size += 1
+        
+        self._values[head] = value
+        self._timestamps[head] = monotonic
+        self._sum += value
+        if value < self._min:
+            self._min = value
+        if value > self._max:
+            self._max = value
+        
+        self._head = head = (head + 1) % self.max_history
+        if head == 0:
+            # Resync once per lap so float error in the running sum cannot build up
+            self._sum = float(self._values[:self._size].sum())
+        
         self.current_value = value
-        self.last_update = point.timestamp
+        self.last_update = monotonic + self._epoch_offset
     
     def get_latest(self) -> Optional[float]:
         """Get latest value."""
         return self.current_value
     
+    def _window(self, duration: Optional[timedelta] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (monotonic timestamps, values) oldest first, optionally cut to duration."""
+        size = self._size
+        head = self._head
+        if size < self.max_history or head == 0:
+            timestamps = self._timestamps[:size]
+            values = self._values[:size]
+        else:
+            timestamps = np.concatenate((self._timestamps[head:], self._timestamps[:head]))
+            values = np.concatenate((self._values[head:], self._values[:head]))
+        
+        if duration:
+            cutoff = time.monotonic() - duration.total_seconds()
+            start = int(np.searchsorted(timestamps, cutoff, side='left'))
+            timestamps = timestamps[start:]
+            values = values[start:]
+        
+        return timestamps, values
+    
     def get_history(self, duration: Optional[timedelta] = None) -> List[MetricPoint]:
         """Get history, optionally filtered by duration."""
-        if not duration:
-            return list(self.history)
-        
-        cutoff = time.time() - duration.total_seconds()
-        return [p for p in self.history if p.timestamp >= cutoff]
+        timestamps, values = self._window(duration)
+        return [
+            MetricPoint(value, timestamp)
+            for value, timestamp in zip(values.tolist(), (timestamps + self._epoch_offset).tolist())
+        ]
+    
+    def export_history(self, duration: Optional[timedelta] = None) -> List[Dict[str, Any]]:
+        """Export history as dicts, formatted like MetricPoint.to_dict but vectorized."""
+        timestamps, values = self._window(duration)
+        epoch = timestamps + self._epoch_offset
+        # Rounded half-even to microseconds, as datetime.fromtimestamp does
+        iso = np.datetime_as_string(np.rint(epoch * 1e6).astype('datetime64[us]'), unit='us')
+        return [
+            {'value': value, 'timestamp': timestamp, 'datetime': text + '+00:00'}
+            for value, timestamp, text in zip(values.tolist(), epoch.tolist(), iso.tolist())
+        ]
     
     def get_stats(self, duration: Optional[timedelta] = None) -> Dict[str, Any]:
         """Get statistics for the metric."""
-        points = self.get_history(duration)
+        if not duration:
+            return self._running_stats()
         
-        if not points:
+        _, values = self._window(duration)
+        
+        if not values.size:
             return {
                 'count': 0,
                 'min': None,
@@ -76,13 +192,44 @@ class Metric:
                 'current': self.current_value
             }
         
-        values = [p.value for p in points]
+        return {
+            'count': int(values.size),
+            'min': float(values.min()),
+            'max': float(values.max()),
+            'avg': float(values.mean()),
+            'current': self.current_value,
+            'last_update': self.last_update
+        }
+    
+    def snapshot(self, duration: Optional[timedelta] = None) -> Dict[str, Any]:
+        """Stats plus current value and last update, from a single reduction."""
+        stats = self.get_stats(duration)
+        stats.setdefault('last_update', self.last_update)
+        return stats
+    
+    def _running_stats(self) -> Dict[str, Any]:
+        """Whole-history stats from the running aggregates."""
+        size = self._size
+        if not size:
+            return {
+                'count': 0,
+                'min': None,
+                'max': None,
+                'avg': None,
+                'current': self.current_value
+            }
+        
+        if self._extrema_stale:
+            values = self._values[:size]
+            self._min = float(values.min())
+            self._max = float(values.max())
+            self._extrema_stale = False
         
         return {
-            'count': len(values),
-            'min': min(values),
-            'max': max(values),
-            'avg': sum(values) / len(values),
+            'count': size,
+            'min': float(self._min),
+            'max': float(self._max),
+            'avg': self._sum / size,
             'current': self.current_value,
             'last_update': self.last_update
         }
@@ -95,6 +242,9 @@ class MetricsCollector:
         self.config = get_config()
         self.metrics: Dict[str, Metric] = {}
         self._collectors: Dict[str, Callable] = {}
+        self._offloaded = set()  # collectors run on the executor, not inline
+        # (name, collector, is_async, offload) per collector, rebuilt on register
+        self._collector_plan: List[Tuple[str, Callable, bool, bool]] = []
         self._collection_interval = 5.0  # Default 5 seconds
         self._collection_task = None
         self._running = False
@@ -103,29 +253,27 @@ class MetricsCollector:
         self._setup_default_collectors()
     
     def _setup_default_collectors(self):
-        """Setup default metric collectors."""
-        # CPU metrics
-        self.register_collector('cpu.percent', self._collect_cpu_percent)
-        self.register_collector('cpu.count', lambda: psutil.cpu_count())
-        
-        # Memory metrics
-        self.register_collector('memory.percent', self._collect_memory_percent)
-        self.register_collector('memory.used', self._collect_memory_used)
-        self.register_collector('memory.available', self._collect_memory_available)
-        
-        # Disk metrics
-        self.register_collector('disk.usage_percent', self._collect_disk_usage)
-        
-        # Network metrics
-        self.register_collector('network.bytes_sent', self._collect_network_bytes_sent)
-        self.register_collector('network.bytes_recv', self._collect_network_bytes_recv)
-        
-        # Process metrics
-        self.register_collector('process.count', lambda: len(psutil.pids()))
+        """Setup default system metrics (filled from one psutil snapshot)."""
+        for metric_name in _SNAPSHOT_METRICS:
+            self.metrics[metric_name] = Metric(metric_name)
     
-    def register_collector(self, metric_name: str, collector: Callable):
-        """Register a metric collector function."""
+    def register_collector(self, metric_name: str, collector: Callable,
+                           offload: bool = False):
+        """Register a metric collector function.
+        
+        Synchronous collectors run inline on the event loop; pass
+        offload=True for ones that block (slow syscalls, subprocesses,
+        network) so they run on the default executor instead.
+        """
         self._collectors[metric_name] = collector
+        if offload:
+            self._offloaded.add(metric_name)
+        else:
+            self._offloaded.discard(metric_name)
+        self._collector_plan = [
+            (name, func, asyncio.iscoroutinefunction(func), name in self._offloaded)
+            for name, func in self._collectors.items()
+        ]
         if metric_name not in self.metrics:
             self.metrics[metric_name] = Metric(metric_name)
     
@@ -166,11 +314,23 @@ class MetricsCollector:
         log.info("Stopped metrics collection")
     
     async def _collection_loop(self):
-        """Main collection loop."""
+        """Main collection loop.
+        
+        Also records how long each collection takes
+        (collector.collection_duration_ms) and how late the loop wakes up
+        after its sleep (collector.loop_lag_ms), so a blocked event loop
+        or a drifting cadence shows up as a metric.
+        """
         while self._running:
             try:
+                started = time.monotonic()
                 await self._collect_all_metrics()
+                finished = time.monotonic()
+                self.add_metric_value('collector.collection_duration_ms', (finished - started) * 1000)
+                
                 await asyncio.sleep(self._collection_interval)
+                lag = time.monotonic() - (finished + self._collection_interval)
+                self.add_metric_value('collector.loop_lag_ms', max(lag, 0.0) * 1000)
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -179,21 +339,36 @@ class MetricsCollector:
     
     async def _collect_all_metrics(self):
         """Collect all registered metrics."""
-        timestamp = time.time()
+        loop = asyncio.get_running_loop()
+        
+        # Default system metrics: one executor hop for the whole snapshot;
+        # the submit-to-start delay exposes default pool starvation
+        submitted = time.monotonic()
+        try:
+            started, snapshot = await loop.run_in_executor(
+                None, _run_timed, self._collect_system_snapshot
+            )
+        except Exception as e:
+            log.warning(f"Failed to collect system metrics: {e}")
+        else:
+            self.add_metric_value('collector.executor_wait_ms', (started - submitted) * 1000)
+            for metric_name, value in snapshot.items():
+                if value is not None:
+                    self.add_metric_value(metric_name, float(value))
         
-        for metric_name, collector in self._collectors.items():
+        for metric_name, collector, is_async, offload in self._collector_plan:
             try:
                 # Run collector
-                if asyncio.iscoroutinefunction(collector):
+                if is_async:
                     value = await collector()
+                elif offload:
+                    value = await loop.run_in_executor(None, collector)
                 else:
-                    value = await asyncio.get_event_loop().run_in_executor(
-                        None, collector
-                    )
+                    value = collector()
                 
                 # Store value
                 if value is not None:
-                    self.add_metric_value(metric_name, float(value), timestamp)
+                    self.add_metric_value(metric_name, float(value))
                     
             except Exception as e:
                 log.warning(f"Failed to collect metric {metric_name}: {e}")
@@ -203,56 +378,40 @@ class MetricsCollector:
         result = {}
         
         for name, metric in self.metrics.items():
+            stats = metric.snapshot()
             result[name] = {
-                'current': metric.get_latest(),
-                'last_update': metric.last_update,
-                'stats': metric.get_stats()
+                'current': stats['current'],
+                'last_update': stats['last_update'],
+                'stats': stats
             }
         
         return result
     
     def get_metrics_summary(self, duration: Optional[timedelta] = None) -> Dict[str, Any]:
         """Get summary of all metrics."""
-        summary = {
-            'metrics': {},
+        return {
+            'metrics': {name: metric.snapshot(duration) for name, metric in self.metrics.items()},
             'collection_interval': self._collection_interval,
             'is_running': self._running,
             'timestamp': time.time()
         }
-        
-        for name, metric in self.metrics.items():
-            summary['metrics'][name] = metric.get_stats(duration)
-        
-        return summary
     
     # Collector implementations
-    def _collect_cpu_percent(self) -> float:
-        """Collect CPU usage percentage without blocking the event loop."""
-        return psutil.cpu_percent(interval=0)
-    
-    def _collect_memory_percent(self) -> float:
-        """Collect memory usage percentage."""
-        return psutil.virtual_memory().percent
-    
-    def _collect_memory_used(self) -> float:
-        """Collect used memory in bytes."""
-        return psutil.virtual_memory().used
-    
-    def _collect_memory_available(self) -> float:
-        """Collect available memory in bytes."""
-        return psutil.virtual_memory().available
-    
-    def _collect_disk_usage(self) -> float:
-        """Collect disk usage percentage for root."""
-        return psutil.disk_usage('/').percent
-    
-    def _collect_network_bytes_sent(self) -> float:
-        """Collect total network bytes sent."""
-        return psutil.net_io_counters().bytes_sent
-    
-    def _collect_network_bytes_recv(self) -> float:
-        """Collect total network bytes received."""
-        return psutil.net_io_counters().bytes_recv
+    def _collect_system_snapshot(self) -> Dict[str, float]:
+        """Probe psutil once per source and derive all default metrics."""
+        memory = psutil.virtual_memory()
+        network = psutil.net_io_counters()
+        return {
+            'cpu.percent': get_cpu_percent()[0],
+            'cpu.count': psutil.cpu_count(),
+            'memory.percent': memory.percent,
+            'memory.used': memory.used,
+            'memory.available': memory.available,
+            'disk.usage_percent': psutil.disk_usage('/').percent,
+            'network.bytes_sent': network.bytes_sent,
+            'network.bytes_recv': network.bytes_recv,
+            'process.count': len(psutil.pids()),
+        }
 
 
 class AlertRule:
@@ -267,30 +426,24 @@ class AlertRule:
         self.duration = duration
         self.triggered = False
         self.trigger_time = None
+        # Unknown conditions never trigger
+        self._compare = _ALERT_COMPARATORS.get(condition, lambda value, threshold: False)
     
     def evaluate(self, value: float) -> bool:
         """Evaluate if alert should trigger."""
-        if value is None:
-            return False
-        
-        conditions = {
-            'gt': value > self.threshold,
-            'lt': value < self.threshold,
-            'gte': value >= self.threshold,
-            'lte': value <= self.threshold,
-            'eq': value == self.threshold
-        }
-        
-        return conditions.get(self.condition, False)
+        return value is not None and self._compare(value, self.threshold)
 
 
 class AlertManager:
     """Manages metric alerts."""
     
-    def __init__(self, metrics_collector: MetricsCollector):
+    def __init__(self, metrics_collector: MetricsCollector, max_alerts: int = 10_000):
         self.metrics_collector = metrics_collector
         self.rules: Dict[str, AlertRule] = {}
-        self.alerts: List[Dict[str, Any]] = []
+        # Alert history; oldest entries are dropped once max_alerts is reached
+        self.alerts = deque(maxlen=max_alerts)
+        # (metric, duration) -> [(ufunc, rules, thresholds)], rebuilt when rules change
+        self._rule_groups: Dict[Tuple[str, Optional[timedelta]], List[Tuple[Any, List[AlertRule], np.ndarray]]] = {}
         self.alert_handlers: List[Callable] = []
         self._check_interval = 10.0
         self._check_task = None
@@ -299,14 +452,37 @@ class AlertManager:
     def add_rule(self, rule: AlertRule):
         """Add an alert rule."""
         self.rules[rule.name] = rule
+        self._rebuild_rule_groups()
         log.info(f"Added alert rule: {rule.name}")
     
     def remove_rule(self, name: str):
         """Remove an alert rule."""
         if name in self.rules:
             del self.rules[name]
+            self._rebuild_rule_groups()
             log.info(f"Removed alert rule: {name}")
     
+    def _rebuild_rule_groups(self):
+        """Group rules by (metric, duration), then by condition with a threshold array.
+        
+        Each group's value is computed once per check and compared against
+        all of its thresholds in one NumPy call. Rules with an unknown
+        condition never trigger and are left out.
+        """
+        by_key = defaultdict(lambda: defaultdict(list))
+        for rule in self.rules.values():
+            if rule.condition in _ALERT_UFUNCS:
+                by_key[(rule.metric, rule.duration)][rule.condition].append(rule)
+        
+        self._rule_groups = {
+            key: [
+                (_ALERT_UFUNCS[condition], rules,
+                 np.array([rule.threshold for rule in rules], dtype=np.float64))
+                for condition, rules in by_condition.items()
+            ]
+            for key, by_condition in by_key.items()
+        }
+    
     def add_handler(self, handler: Callable):
         """Add alert handler function."""
         self.alert_handlers.append(handler)
@@ -349,40 +525,45 @@ class AlertManager:
     
     async def _check_all_rules(self):
         """Check all alert rules."""
-        for rule in self.rules.values():
+        for (metric_name, duration), conditions in self._rule_groups.items():
             try:
-                metric = self.metrics_collector.get_metric(rule.metric)
+                metric = self.metrics_collector.get_metric(metric_name)
                 if not metric:
                     continue
                 
-                # Get value to check
-                if rule.duration:
+                # Get value to check (once for every rule in the group)
+                if duration:
                     # Check average over duration
-                    stats = metric.get_stats(rule.duration)
-                    value = stats.get('avg')
+                    value = metric.get_stats(duration).get('avg')
                 else:
                     # Check current value
                     value = metric.get_latest()
                 
                 if value is None:
                     continue
-                
-                # Evaluate rule
-                should_trigger = rule.evaluate(value)
-                
-                if should_trigger and not rule.triggered:
-                    # New alert
-                    rule.triggered = True
-                    rule.trigger_time = time.time()
-                    await self._trigger_alert(rule, value)
-                    
-                elif not should_trigger and rule.triggered:
-                    # Alert resolved
-                    rule.triggered = False
-                    await self._resolve_alert(rule, value)
-                    
             except Exception as e:
-                log.error(f"Error checking rule {rule.name}: {e}")
+                log.error(f"Error reading metric {metric_name} for alert rules: {e}")
+                continue
+            
+            for compare, rules, thresholds in conditions:
+                # Evaluate every threshold for this condition at once
+                fired = compare(value, thresholds).tolist()
+                
+                for rule, should_trigger in zip(rules, fired):
+                    try:
+                        if should_trigger and not rule.triggered:
+                            # New alert
+                            rule.triggered = True
+                            rule.trigger_time = time.time()
+                            await self._trigger_alert(rule, value)
+                            
+                        elif not should_trigger and rule.triggered:
+                            # Alert resolved
+                            rule.triggered = False
+                            await self._resolve_alert(rule, value)
+                            
+                    except Exception as e:
+                        log.error(f"Error checking rule {rule.name}: {e}")
     
     async def _trigger_alert(self, rule: AlertRule, value: float):
         """Trigger an alert."""
@@ -454,4 +635,4 @@ class AlertManager:
     
     def get_alert_history(self, limit: int = 100) -> List[Dict[str, Any]]:
         """Get alert history."""
-        return self.alerts[-limit:]
\ No newline at end of file
+        return list(itertools.islice(reversed(self.alerts), limit))[::-1]
\ No newline at end of file
@@ -1,55 +1,63 @@
 """
 Tools for PC Control MCP Server.
+
+Tool classes are imported lazily (PEP 562) on first access, so importing
+one tool does not load the others or their dependencies.
 """
 
-from .system_tools import SystemTools
-from .process_tools import ProcessTools, ProcessInfo
-from .file_tools import FileTools, FileInfo
-from .network_tools import NetworkTools, NetworkInfo
-from .service_tools import ServiceTools, ServiceInfo
-
-# Only import on Windows
-try:
-    from .registry_tools import RegistryTools
-    __all_registry__ = ['RegistryTools']
-except Exception:
-    __all_registry__ = []
-
-# Import automation tools conditionally
-try:
-    from .automation_tools import AutomationTools
-    __all_automation__ = ['AutomationTools']
-except ImportError:
-    __all_automation__ = []
-
-# New optional tools
-try:
-    from .powershell_tools import PowerShellTools
-    __all_powershell__ = ['PowerShellTools']
-except Exception:
-    __all_powershell__ = []
-
-try:
-    from .scheduler_tools import SchedulerTools
-    __all_scheduler__ = ['SchedulerTools']
-except Exception:
-    __all_scheduler__ = []
-
-try:
-    from .uia_tools import UIATools
-    __all_uia__ = ['UIATools']
-except Exception:
-    __all_uia__ = []
+import importlib
+from importlib.util import find_spec
+
+# Public name -> submodule that defines it
+_LAZY = {
+    'SystemTools': '.system_tools',
+    'ProcessTools': '.process_tools',
+    'ProcessInfo': '.process_tools',
+    'FileTools': '.file_tools',
+    'FileInfo': '.file_tools',
+    'NetworkTools': '.network_tools',
+    'NetworkInfo': '.network_tools',
+    'ServiceTools': '.service_tools',
+    'ServiceInfo': '.service_tools',
+    
+    # Optional tools
+    'RegistryTools': '.registry_tools',
+    'AutomationTools': '.automation_tools',
+    'PowerShellTools': '.powershell_tools',
+    'SchedulerTools': '.scheduler_tools',
+    'UIATools': '.uia_tools',
+}
+
+# Third-party modules each optional tool needs at import time (its
+# platform-specific backends are guarded inside the module itself)
+_OPTIONAL_REQUIREMENTS = {
+    'RegistryTools': (),
+    'AutomationTools': ('PIL', 'numpy'),
+    'PowerShellTools': (),
+    'SchedulerTools': (),
+    'UIATools': (),
+}
+
+
+def _is_available(name: str) -> bool:
+    """Check an optional tool's requirements without importing them."""
+    return all(find_spec(module) is not None for module in _OPTIONAL_REQUIREMENTS[name])
+
+
+def __getattr__(name: str):
+    module_path = _LAZY.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __all__ = [
-    'SystemTools',
-    'ProcessTools',
-    'ProcessInfo', 
-    'FileTools',
-    'FileInfo',
-    'NetworkTools',
-    'NetworkInfo',
-    'ServiceTools',
-    'ServiceInfo'
-] + __all_registry__ + __all_automation__
-__all__ += __all_powershell__ + __all_scheduler__ + __all_uia__
\ No newline at end of file
+    name for name in _LAZY
+    if name not in _OPTIONAL_REQUIREMENTS or _is_available(name)
+]
@@ -6,7 +6,8 @@ import asyncio
 import base64
 import io
 import time
-from typing import Dict, Any, List, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple, Union, Callable
 from pathlib import Path
 from datetime import datetime, timezone
 
@@ -16,6 +17,14 @@ try:
 except ImportError:
     PYAUTOGUI_AVAILABLE = False
     pyautogui = None
+
+try:
+    import mss
+    import mss.tools
+    MSS_AVAILABLE = True
+except ImportError:
+    MSS_AVAILABLE = False
+    mss = None
     
 from PIL import Image, ImageDraw, ImageGrab
 import numpy as np
@@ -28,6 +37,8 @@ from ..core import (
     ValidationException,
     get_config
 )
+from ..utils.platform_utils import is_windows, is_linux, is_macos
+from ..utils.executors import get_io_executor
 
 log = StructuredLogger(__name__)
 
@@ -37,6 +48,132 @@ if PYAUTOGUI_AVAILABLE:
     pyautogui.PAUSE = 0.1
 
 
+def _send_unicode_input(text: str) -> int:
+    """Type text on Windows with a single batched SendInput call.
+    
+    Every UTF-16 code unit becomes a KEYEVENTF_UNICODE key down/up pair;
+    newlines and tabs are sent as VK_RETURN/VK_TAB so they behave like
+    real key presses.
+    
+    Returns:
+        Number of input events injected
+    """
+    import ctypes
+    from ctypes import wintypes
+    
+    KEYEVENTF_KEYUP = 0x0002
+    KEYEVENTF_UNICODE = 0x0004
+    INPUT_KEYBOARD = 1
+    VK_RETURN = 0x0D
+    VK_TAB = 0x09
+    
+    class KEYBDINPUT(ctypes.Structure):
+        _fields_ = [
+            ('wVk', wintypes.WORD),
+            ('wScan', wintypes.WORD),
+            ('dwFlags', wintypes.DWORD),
+            ('time', wintypes.DWORD),
+            ('dwExtraInfo', ctypes.c_size_t)
+        ]
+    
+    class MOUSEINPUT(ctypes.Structure):
+        _fields_ = [
+            ('dx', wintypes.LONG),
+            ('dy', wintypes.LONG),
+            ('mouseData', wintypes.DWORD),
+            ('dwFlags', wintypes.DWORD),
+            ('time', wintypes.DWORD),
+            ('dwExtraInfo', ctypes.c_size_t)
+        ]
+    
+    class _INPUTUNION(ctypes.Union):
+        _fields_ = [('ki', KEYBDINPUT), ('mi', MOUSEINPUT)]
+    
+    class INPUT(ctypes.Structure):
+        _fields_ = [('type', wintypes.DWORD), ('union', _INPUTUNION)]
+    
+    events = []
+    for ch in text.replace('\r\n', '\n'):
+        if ch == '\n' or ch == '\t':
+            vk = VK_RETURN if ch == '\n' else VK_TAB
+            events.append((vk, 0, 0))
+            events.append((vk, 0, KEYEVENTF_KEYUP))
+            continue
+        data = ch.encode('utf-16-le')
+        for i in range(0, len(data), 2):
+            unit = int.from_bytes(data[i:i + 2], 'little')
+            events.append((0, unit, KEYEVENTF_UNICODE))
+            events.append((0, unit, KEYEVENTF_UNICODE | KEYEVENTF_KEYUP))
+    
+    if not events:
+        return 0
+    
+    inputs = (INPUT * len(events))()
+    for item, (vk, scan, flags) in zip(inputs, events):
+        item.type = INPUT_KEYBOARD
+        item.union.ki = KEYBDINPUT(vk, scan, flags, 0, 0)
+    
+    sent = ctypes.windll.user32.SendInput(len(events), inputs, ctypes.sizeof(INPUT))
+    if sent != len(events):
+        raise ctypes.WinError()
+    return sent
+
+
+def _post_unicode_events(text: str) -> int:
+    """Type text on macOS by attaching Unicode strings to Quartz key events.
+    
+    CGEventKeyboardSetUnicodeString carries up to 20 UTF-16 code units per
+    event, so long text needs only a handful of event posts. Newlines and
+    tabs are sent as Return/Tab key presses so they behave like real keys.
+    
+    Returns:
+        Number of key events posted
+    """
+    import Quartz
+    
+    KVK_RETURN = 0x24
+    KVK_TAB = 0x30
+    chunk_bytes = 40  # 20 UTF-16 code units
+    posted = 0
+    
+    def post_key(keycode: int):
+        nonlocal posted
+        for key_down in (True, False):
+            event = Quartz.CGEventCreateKeyboardEvent(None, keycode, key_down)
+            Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
+            posted += 1
+    
+    def post_text(run: str):
+        nonlocal posted
+        data = run.encode('utf-16-le')
+        i = 0
+        while i < len(data):
+            chunk = data[i:i + chunk_bytes]
+            # Don't split a surrogate pair across events; the high
+            # surrogate starts the next chunk instead
+            if len(chunk) == chunk_bytes and 0xD800 <= int.from_bytes(chunk[-2:], 'little') <= 0xDBFF:
+                chunk = chunk[:-2]
+            i += len(chunk)
+            chunk_text = chunk.decode('utf-16-le')
+            for key_down in (True, False):
+                event = Quartz.CGEventCreateKeyboardEvent(None, 0, key_down)
+                Quartz.CGEventKeyboardSetUnicodeString(event, len(chunk) // 2, chunk_text)
+                Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
+                posted += 1
+    
+    run_start = 0
+    text = text.replace('\r\n', '\n')
+    for index, ch in enumerate(text):
+        if ch == '\n' or ch == '\t':
+            if index > run_start:
+                post_text(text[run_start:index])
+            post_key(KVK_RETURN if ch == '\n' else KVK_TAB)
+            run_start = index + 1
+    if run_start < len(text):
+        post_text(text[run_start:])
+    return posted
+
+
 def require_pyautogui(func):
     """Decorator to check if pyautogui is available."""
     async def wrapper(*args, **kwargs):
@@ -83,6 +220,19 @@ class AutomationTools:
         self._screen_size_time = None
         self._screen_cache_ttl = 60  # 60 seconds
         
+        # Lazily created libxdo handle for native typing on X11
+        self._xdo = None
+        
+        # Native batched text input, loaded on first use (see _native_backend)
+        self._fast_type = None
+        self._fast_type_method = None
+        self._fast_type_loaded = False
+        
+        # Lazily created mss handle, kept open across captures. mss keeps
+        # per-thread display/DC state, so all captures run on one thread.
+        self._mss = None
+        self._capture_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pcmcp-capture")
+        
     def _check_availability(self):
         """Check if PyAutoGUI is available."""
         if not PYAUTOGUI_AVAILABLE:
@@ -354,6 +504,60 @@ class AutomationTools:
             log.error(f"Failed to scroll mouse: {e}", exception=e)
             raise AutomationException(f"Failed to scroll mouse: {str(e)}")
     
+    def _native_backend(self) -> Optional[Callable[[str], Any]]:
+        """Load the platform's batched text-input backend once.
+        
+        Returns:
+            The typing function, or None if no native backend can be loaded
+        """
+        if self._fast_type_loaded:
+            return self._fast_type
+        self._fast_type_loaded = True
+        
+        try:
+            if is_windows():
+                import ctypes
+                ctypes.windll.user32  # raises if user32 cannot be loaded
+                self._fast_type, self._fast_type_method = _send_unicode_input, 'sendinput'
+            elif is_linux():
+                from xdo import Xdo
+                self._xdo = Xdo()
+                self._fast_type, self._fast_type_method = self._xdo_enter_text, 'xdo'
+            elif is_macos():
+                import Quartz  # noqa: F401
+                self._fast_type, self._fast_type_method = _post_unicode_events, 'quartz'
+        except Exception as e:
+            # Nothing has been typed yet, so pyautogui can take over safely
+            log.debug(f"Native text input unavailable, falling back to pyautogui: {e}")
+            self._fast_type = self._fast_type_method = None
+        
+        return self._fast_type
+    
+    def _type_text_native(self, text: str) -> Optional[str]:
+        """Type text in one batched OS call.
+        
+        The native backends inject the whole string at once, so they do not
+        apply pyautogui.PAUSE between keystrokes. The pyautogui failsafe
+        (mouse in a screen corner) is checked once before typing starts.
+        Errors raised while typing are propagated rather than retried with
+        pyautogui, since part of the text may already have been injected.
+        
+        Returns:
+            Name of the backend used, or None if no native backend is available
+        """
+        fast_type = self._native_backend()
+        if fast_type is None:
+            return None
+        if PYAUTOGUI_AVAILABLE and pyautogui.FAILSAFE:
+            pyautogui.failSafeCheck()
+        fast_type(text)
+        return self._fast_type_method
+    
+    def _xdo_enter_text(self, text: str):
+        """Type text on X11 through libxdo."""
+        # CURRENTWINDOW (0) targets the focused window; no per-key delay
+        self._xdo.enter_text_window(0, text.encode('utf-8'), delay=0)
+    
     async def type_text(self, text: str, interval: float = 0.0) -> Dict[str, Any]:
         """Type text using keyboard.
         
@@ -369,15 +573,26 @@ class AutomationTools:
             if self.security:
                 text = self.security.validate_input('command', text)
             
-            # Type text
-            await asyncio.get_event_loop().run_in_executor(
-                None, pyautogui.typewrite, text, interval
-            )
+            # Type text: batch through the native input API unless a
+            # per-keystroke interval was explicitly requested
+            method = None
+            if not interval or interval <= 0:
+                method = await asyncio.get_running_loop().run_in_executor(
+                    get_io_executor(), self._type_text_native, text
+                )
+            
+            if method is None:
+                self._check_availability()
+                await asyncio.get_event_loop().run_in_executor(
+                    None, pyautogui.typewrite, text, interval
+                )
+                method = 'pyautogui'
             
             return {
                 'action': 'type_text',
                 'text_length': len(text),
                 'interval': interval,
+                'method': method,
                 'success': True
             }
             
@@ -430,18 +645,112 @@ class AutomationTools:
         """
         return await self.press_key(list(keys))
     
+    def close(self):
+        """Release native capture resources and the capture thread."""
+        if self._mss is not None:
+            try:
+                self._mss.close()
+            except Exception:
+                pass
+            self._mss = None
+        self._capture_executor.shutdown(wait=False)
+    
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+    
+    def _grab_screen(self, region: Optional[Tuple[int, int, int, int]] = None):
+        """Capture the primary screen (or a region of it).
+        
+        Uses a cached mss handle when available so the display connection /
+        device contexts are not recreated per capture, and returns the raw
+        mss ScreenShot without materializing a PIL image. Falls back to
+        pyautogui, which returns a PIL image.
+        """
+        if MSS_AVAILABLE:
+            if self._mss is None:
+                self._mss = mss.mss()
+            if region:
+                x, y, width, height = region
+                monitor = {'left': x, 'top': y, 'width': width, 'height': height}
+            else:
+                monitor = self._mss.monitors[1]
+            return self._mss.grab(monitor)
+        
+        self._check_availability()
+        if region:
+            return pyautogui.screenshot(region=region)
+        return pyautogui.screenshot()
+    
+    @staticmethod
+    def _to_pil(shot) -> Image.Image:
+        """Convert a capture to a PIL image (no-op for PIL input)."""
+        if isinstance(shot, Image.Image):
+            return shot
+        return Image.frombytes('RGB', shot.size, shot.bgra, 'raw', 'BGRX')
+    
+    def _grab_pil(self, region: Optional[Tuple[int, int, int, int]] = None) -> Image.Image:
+        """Capture the screen as a PIL image."""
+        return self._to_pil(self._grab_screen(region))
+    
+    @staticmethod
+    def _encode_png(shot) -> bytes:
+        """Encode a capture to PNG bytes.
+        
+        mss captures are encoded straight from their RGB buffer with zlib,
+        skipping the PIL round-trip.
+        """
+        if not isinstance(shot, Image.Image):
+            return mss.tools.to_png(shot.rgb, shot.size)
+        buffer = io.BytesIO()
+        shot.save(buffer, format='PNG')
+        return buffer.getvalue()
+    
+    @staticmethod
+    def _raw_rgb(shot) -> bytes:
+        """Return packed 24-bit RGB bytes of a capture."""
+        if not isinstance(shot, Image.Image):
+            return shot.rgb
+        return shot.convert('RGB').tobytes()
+    
+    def _save_image(self, shot, save_path: str):
+        """Write a capture to disk, format inferred from the extension.
+        
+        PNG files are written at zlib level 6, which gets most of the size
+        reduction of level 9 for a fraction of the encode time. PIL's
+        optimize flag is not used: it forces level 9 regardless of
+        compress_level.
+        """
+        is_png = Path(save_path).suffix.lower() == '.png'
+        if not isinstance(shot, Image.Image) and is_png:
+            mss.tools.to_png(shot.rgb, shot.size, level=6, output=save_path)
+            return
+        image = self._to_pil(shot)
+        if is_png:
+            image.save(save_path, format='PNG', compress_level=6)
+        else:
+            image.save(save_path)
+    
     async def take_screenshot(self, region: Optional[Tuple[int, int, int, int]] = None,
-                            save_path: Optional[str] = None) -> Dict[str, Any]:
+                            save_path: Optional[str] = None,
+                            return_bytes: bool = False,
+                            raw_rgb: bool = False) -> Dict[str, Any]:
         """Take a screenshot.
         
         Args:
             region: Region to capture (x, y, width, height) or None for full screen
             save_path: Path to save screenshot or None to return base64
+            return_bytes: Also return base64 image data when saving to a file
+            raw_rgb: Return raw packed RGB bytes instead of PNG (no encoding)
             
         Returns:
             Dictionary with screenshot information
         """
         try:
+            loop = asyncio.get_running_loop()
+            
             # Take screenshot
             if region:
                 # Validate region
@@ -451,36 +760,58 @@ class AutomationTools:
                 width = min(width, screen_width - x)
                 height = min(height, screen_height - y)
                 
-                screenshot = await asyncio.get_event_loop().run_in_executor(
-                    None, pyautogui.screenshot, region=(x, y, width, height)
+                screenshot = await loop.run_in_executor(
+                    self._capture_executor, self._grab_screen, (x, y, width, height)
                 )
             else:
-                screenshot = await asyncio.get_event_loop().run_in_executor(
-                    None, pyautogui.screenshot
+                screenshot = await loop.run_in_executor(
+                    self._capture_executor, self._grab_screen
                 )
             
             result = {
                 'action': 'take_screenshot',
                 'size': {'width': screenshot.width, 'height': screenshot.height},
-                'mode': screenshot.mode,
+                'mode': getattr(screenshot, 'mode', 'RGB'),
                 'timestamp': datetime.now(timezone.utc).isoformat()
             }
             
+            png_bytes = None
+            
             if save_path:
                 # Validate path
                 if self.security:
                     save_path = self.security.validate_input('path', save_path)
                 
-                # Save to file
-                screenshot.save(save_path)
+                if return_bytes and not raw_rgb and Path(save_path).suffix.lower() == '.png':
+                    # Encode once and reuse the buffer for both file and payload
+                    png_bytes = await loop.run_in_executor(
+                        get_io_executor(), self._encode_png, screenshot
+                    )
+                    await loop.run_in_executor(
+                        get_io_executor(), Path(save_path).write_bytes, png_bytes
+                    )
+                    result['file_size'] = len(png_bytes)
+                else:
+                    # Save to file
+                    await loop.run_in_executor(get_io_executor(), self._save_image, screenshot, save_path)
+                    result['file_size'] = Path(save_path).stat().st_size
                 result['saved_to'] = save_path
-                result['file_size'] = Path(save_path).stat().st_size
-            else:
-                # Convert to base64
-                buffer = io.BytesIO()
-                screenshot.save(buffer, format='PNG')
-                buffer.seek(0)
-                result['image_data'] = base64.b64encode(buffer.read()).decode('utf-8')
+            
+            if raw_rgb and (return_bytes or not save_path):
+                # Skip encoding entirely for consumers that only analyze pixels
+                rgb_bytes = await loop.run_in_executor(
+                    get_io_executor(), self._raw_rgb, screenshot
+                )
+                result['image_data'] = base64.b64encode(rgb_bytes).decode('utf-8')
+                result['format'] = 'base64_rgb'
+            elif png_bytes is None and (return_bytes or not save_path):
+                # In-memory encode, nothing touches the filesystem
+                png_bytes = await loop.run_in_executor(
+                    get_io_executor(), self._encode_png, screenshot
+                )
+            
+            if png_bytes is not None:
+                result['image_data'] = base64.b64encode(png_bytes).decode('utf-8')
                 result['format'] = 'base64_png'
             
             result['success'] = True
@@ -650,8 +981,8 @@ class AutomationTools:
             x, y = self._validate_coordinates(x, y)
             
             # Get pixel color
-            screenshot = await asyncio.get_event_loop().run_in_executor(
-                None, pyautogui.screenshot, region=(x, y, 1, 1)
+            screenshot = await asyncio.get_running_loop().run_in_executor(
+                self._capture_executor, self._grab_pil, (x, y, 1, 1)
             )
             
             r, g, b = screenshot.getpixel((0, 0))
@@ -23,6 +23,7 @@ from ..core import (
     get_config
 )
 from ..utils.platform_utils import normalize_path, is_windows
+from ..utils.executors import get_io_executor
 
 log = StructuredLogger(__name__)
 
@@ -30,9 +31,9 @@ log = StructuredLogger(__name__)
 class FileInfo:
     """File information container."""
     
-    def __init__(self, path: Path):
+    def __init__(self, path: Path, stat_result: Optional[os.stat_result] = None):
         self.path = path
-        self._stat = None
+        self._stat = stat_result
     
     def get_info(self) -> Dict[str, Any]:
         """Get file information."""
@@ -40,10 +41,10 @@ class FileInfo:
             if not self._stat:
                 self._stat = self.path.stat()
             
-            # Get file type
-            if self.path.is_file():
+            # Get file type from the cached stat instead of re-stat'ing
+            if stat.S_ISREG(self._stat.st_mode):
                 file_type = "file"
-            elif self.path.is_dir():
+            elif stat.S_ISDIR(self._stat.st_mode):
                 file_type = "directory"
             elif self.path.is_symlink():
                 file_type = "symlink"
@@ -145,6 +146,11 @@ class FileTools:
         self.security = security_manager
         self.config = get_config()
     
+    async def _run_io(self, func, *args):
+        """Run a blocking filesystem call on the shared I/O pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(get_io_executor(), func, *args)
+    
     async def read_file(self, path: str, encoding: str = 'utf-8', 
                        max_size: Optional[int] = None) -> Dict[str, Any]:
         """Read file contents.
@@ -169,15 +175,17 @@ class FileTools:
             
             file_path = Path(validated_path)
             
-            # Check if file exists
-            if not file_path.exists():
+            # One stat answers existence, type and size
+            try:
+                file_stat = file_path.stat()
+            except (FileNotFoundError, NotADirectoryError):
                 raise FileOperationException(f"File not found: {validated_path}")
             
-            if not file_path.is_file():
+            if not stat.S_ISREG(file_stat.st_mode):
                 raise FileOperationException(f"Path is not a file: {validated_path}")
             
             # Check file size
-            file_size = file_path.stat().st_size
+            file_size = file_stat.st_size
             max_allowed_size = max_size or self.config.get('file_operations.max_file_size', 104857600)
             
             if file_size > max_allowed_size:
@@ -192,37 +200,37 @@ class FileTools:
                     f"File extension '{file_path.suffix}' is blocked"
                 )
             
-            # Read file
+            # Read file as bytes once and decode in a single pass
+            async with aiofiles.open(file_path, 'rb') as f:
+                raw_content = await f.read()
+            file_hash = hashlib.sha256(raw_content).hexdigest()
+            
             try:
-                async with aiofiles.open(file_path, 'r', encoding=encoding) as f:
-                    content = await f.read()
-                
-                # Calculate hash
-                file_hash = hashlib.sha256(content.encode(encoding)).hexdigest()
-                
-                return {
-                    'path': str(file_path),
-                    'content': content,
-                    'size': file_size,
-                    'encoding': encoding,
-                    'hash': file_hash,
-                    'lines': content.count('\n') + 1 if content else 0
-                }
-                
+                content = raw_content.decode(encoding)
             except UnicodeDecodeError:
-                # Try reading as binary
-                async with aiofiles.open(file_path, 'rb') as f:
-                    binary_content = await f.read()
-                
+                # Not text in this encoding: return as binary
                 return {
                     'path': str(file_path),
-                    'content': binary_content.hex(),
+                    'content': raw_content.hex(),
                     'size': file_size,
                     'encoding': 'binary',
-                    'hash': hashlib.sha256(binary_content).hexdigest(),
+                    'hash': file_hash,
                     'is_binary': True
                 }
-                
+            
+            # Match text-mode universal newline handling
+            if '\r' in content:
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
+            
+            return {
+                'path': str(file_path),
+                'content': content,
+                'size': file_size,
+                'encoding': encoding,
+                'hash': file_hash,
+                'lines': content.count('\n') + 1 if content else 0
+            }
+            
         except FileOperationException:
             raise
         except Exception as e:
@@ -276,10 +284,14 @@ class FileTools:
                     f"Parent directory does not exist: {file_path.parent}"
                 )
             
-            # Write file
+            # Write file (encode once, write the bytes in one call)
             mode = 'a' if append else 'w'
-            async with aiofiles.open(file_path, mode, encoding=encoding) as f:
-                await f.write(content)
+            if os.linesep != '\n':
+                # Binary mode skips text-mode newline translation; apply it here
+                content = content.replace('\n', os.linesep)
+            data = content.encode(encoding)
+            async with aiofiles.open(file_path, mode + 'b') as f:
+                await f.write(data)
             
             # Get file info
             stat_info = file_path.stat()
@@ -322,15 +334,17 @@ class FileTools:
             
             file_path = Path(validated_path)
             
-            # Check if file exists
-            if not file_path.exists():
+            # One stat answers existence and type, and feeds FileInfo
+            try:
+                file_stat = file_path.stat()
+            except (FileNotFoundError, NotADirectoryError):
                 raise FileOperationException(f"File not found: {validated_path}")
             
-            if not file_path.is_file():
+            if not stat.S_ISREG(file_stat.st_mode):
                 raise FileOperationException(f"Path is not a file: {validated_path}")
             
             # Get file info before deletion
-            file_info = FileInfo(file_path).get_info()
+            file_info = FileInfo(file_path, file_stat).get_info()
             
             # Handle readonly files
             if force and file_info['is_readonly']:
@@ -391,15 +405,18 @@ class FileTools:
             if not source_path.is_file():
                 raise FileOperationException(f"Source is not a file: {source_path}")
             
+            # Copying into a directory keeps the source file name
+            if dest_path.is_dir():
+                dest_path = dest_path / source_path.name
+            
             # Check destination
             if dest_path.exists() and not overwrite:
                 raise FileOperationException(f"Destination already exists: {dest_path}")
             
-            # Copy file
-            if preserve_metadata:
-                shutil.copy2(source_path, dest_path)
-            else:
-                shutil.copy(source_path, dest_path)
+            # Copy file (both use the kernel fast path, e.g. sendfile); copy
+            # keeps the permission bits, copy2 also timestamps and flags
+            copy_func = shutil.copy2 if preserve_metadata else shutil.copy
+            await self._run_io(copy_func, source_path, dest_path)
             
             # Get file info
             dest_info = FileInfo(dest_path).get_info()
@@ -463,7 +480,7 @@ class FileTools:
             source_info = FileInfo(source_path).get_info()
             
             # Move file
-            shutil.move(str(source_path), str(dest_path))
+            await self._run_io(shutil.move, str(source_path), str(dest_path))
             
             return {
                 'source': str(source_path),
@@ -513,62 +530,10 @@ class FileTools:
             if not dir_path.is_dir():
                 raise FileOperationException(f"Path is not a directory: {validated_path}")
             
-            entries = []
-            
-            if recursive:
-                # Recursive listing
-                for root, dirs, files in os.walk(dir_path):
-                    # Check depth
-                    depth = len(Path(root).relative_to(dir_path).parts)
-                    if max_depth is not None and depth > max_depth:
-                        dirs.clear()  # Don't recurse deeper
-                        continue
-                    
-                    # Process directories
-                    for dir_name in dirs:
-                        if not include_hidden and dir_name.startswith('.'):
-                            continue
-                        
-                        if pattern and not glob.fnmatch.fnmatch(dir_name, pattern):
-                            continue
-                        
-                        dir_full_path = Path(root) / dir_name
-                        try:
-                            entries.append(FileInfo(dir_full_path).get_info())
-                        except Exception:
-                            continue
-                    
-                    # Process files
-                    for file_name in files:
-                        if not include_hidden and file_name.startswith('.'):
-                            continue
-                        
-                        if pattern and not glob.fnmatch.fnmatch(file_name, pattern):
-                            continue
-                        
-                        file_full_path = Path(root) / file_name
-                        try:
-                            entries.append(FileInfo(file_full_path).get_info())
-                        except Exception:
-                            continue
-            else:
-                # Non-recursive listing
-                for entry in dir_path.iterdir():
-                    if not include_hidden and entry.name.startswith('.'):
-                        continue
-                    
-                    if pattern and not glob.fnmatch.fnmatch(entry.name, pattern):
-                        continue
-                    
-                    try:
-                        entries.append(FileInfo(entry).get_info())
-                    except Exception:
-                        continue
-            
-            # Sort entries
-            entries.sort(key=lambda x: (x['type'] != 'directory', x['name'].lower()))
-            
-            return entries
+            return await self._run_io(
+                self._list_directory_sync, dir_path, recursive, pattern,
+                include_hidden, max_depth
+            )
             
         except FileOperationException:
             raise
@@ -576,6 +541,71 @@ class FileTools:
             log.error(f"Failed to list directory '{path}': {e}", exception=e)
             raise FileOperationException(f"Failed to list directory: {str(e)}")
     
+    def _list_directory_sync(self, dir_path: Path, recursive: bool,
+                             pattern: Optional[str], include_hidden: bool,
+                             max_depth: Optional[int]) -> List[Dict[str, Any]]:
+        """Blocking directory walk used by list_directory.
+        
+        Uses os.scandir so the entry type comes from the directory read and
+        each child is stat'ed once for its metadata.
+        """
+        entries = []
+        
+        def include(entry: os.DirEntry) -> bool:
+            if not include_hidden and entry.name.startswith('.'):
+                return False
+            if pattern and not glob.fnmatch.fnmatch(entry.name, pattern):
+                return False
+            return True
+        
+        def entry_info(entry: os.DirEntry) -> Optional[Dict[str, Any]]:
+            try:
+                return FileInfo(Path(entry.path), entry.stat()).get_info()
+            except Exception:
+                return None
+        
+        if recursive:
+            # Recursive listing (same traversal as os.walk: symlinked
+            # directories are listed but not descended into)
+            pending = [(dir_path, 0)]
+            while pending:
+                current, depth = pending.pop()
+                if max_depth is not None and depth > max_depth:
+                    continue
+                
+                try:
+                    with os.scandir(current) as it:
+                        children = list(it)
+                except OSError:
+                    continue
+                
+                for entry in children:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    
+                    if is_dir and not entry.is_symlink():
+                        pending.append((Path(entry.path), depth + 1))
+                    
+                    if include(entry):
+                        info = entry_info(entry)
+                        if info is not None:
+                            entries.append(info)
+        else:
+            # Non-recursive listing
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    if include(entry):
+                        info = entry_info(entry)
+                        if info is not None:
+                            entries.append(info)
+        
+        # Sort entries
+        entries.sort(key=lambda x: (x['type'] != 'directory', x['name'].lower()))
+        
+        return entries
+    
     async def create_directory(self, path: str, parents: bool = True,
                              exist_ok: bool = True) -> Dict[str, Any]:
         """Create a directory.
@@ -651,22 +681,25 @@ class FileTools:
             
             file_path = Path(validated_path)
             
-            # Check if exists
-            if not file_path.exists():
+            # One stat answers existence and type, and feeds FileInfo
+            try:
+                file_stat = file_path.stat()
+            except (FileNotFoundError, NotADirectoryError):
                 raise FileOperationException(f"Path not found: {validated_path}")
             
             # Get file info
-            info = FileInfo(file_path).get_info()
+            info = FileInfo(file_path, file_stat).get_info()
             
             # Add additional info for files
-            if file_path.is_file():
+            if stat.S_ISREG(file_stat.st_mode):
                 # Calculate hash for small files
                 if info['size'] and info['size'] < 10485760:  # 10MB
                     try:
+                        # One read feeds both digests
                         with open(file_path, 'rb') as f:
-                            info['md5'] = hashlib.md5(f.read()).hexdigest()
-                            f.seek(0)
-                            info['sha256'] = hashlib.sha256(f.read()).hexdigest()
+                            data = f.read()
+                        info['md5'] = hashlib.md5(data).hexdigest()
+                        info['sha256'] = hashlib.sha256(data).hexdigest()
                     except Exception:
                         pass
             
@@ -748,13 +781,16 @@ class FileTools:
                                 matches.append(str(Path(root) / file_name))
             else:
                 for entry in search_dir.iterdir():
+                    # Cheapest filter first: the name is already known, the
+                    # type checks below each cost a stat() call
+                    if not match_pattern(entry.name):
+                        continue
                     if file_type == 'file' and not entry.is_file():
                         continue
                     if file_type == 'directory' and not entry.is_dir():
                         continue
                     
-                    if match_pattern(entry.name):
-                        matches.append(str(entry))
+                    matches.append(str(entry))
             
             # Sort results
             matches.sort()
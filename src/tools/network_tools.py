@@ -26,25 +26,52 @@ from ..utils.platform_utils import is_windows, is_linux, is_macos
 
 log = StructuredLogger(__name__)
 
+# Well-known port -> service name, used by _identify_service
+_COMMON_PORTS = {
+    20: 'FTP-DATA',
+    21: 'FTP',
+    22: 'SSH',
+    23: 'Telnet',
+    25: 'SMTP',
+    53: 'DNS',
+    80: 'HTTP',
+    110: 'POP3',
+    143: 'IMAP',
+    443: 'HTTPS',
+    445: 'SMB',
+    3306: 'MySQL',
+    3389: 'RDP',
+    5432: 'PostgreSQL',
+    5900: 'VNC',
+    8080: 'HTTP-Proxy',
+    8443: 'HTTPS-Alt'
+}
+
 
 class NetworkInfo:
     """Network information container."""
     
-    def __init__(self, interface_name: str):
+    def __init__(self, interface_name: str,
+                 stats_map: Optional[Dict[str, Any]] = None,
+                 addrs_map: Optional[Dict[str, Any]] = None):
         self.interface_name = interface_name
         self._stats = None
         self._addrs = None
+        # Snapshots shared across interfaces to avoid one getifaddrs() per NIC
+        self._stats_map = stats_map
+        self._addrs_map = addrs_map
     
     def get_info(self) -> Dict[str, Any]:
         """Get network interface information."""
         try:
+            stats_map = self._stats_map if self._stats_map is not None else psutil.net_if_stats()
+            addrs_map = self._addrs_map if self._addrs_map is not None else psutil.net_if_addrs()
+            
             # Get interface stats
-            if self.interface_name in psutil.net_if_stats():
-                self._stats = psutil.net_if_stats()[self.interface_name]
+            self._stats = stats_map.get(self.interface_name)
             
             # Get interface addresses
-            if self.interface_name in psutil.net_if_addrs():
-                self._addrs = psutil.net_if_addrs()[self.interface_name]
+            self._addrs = addrs_map.get(self.interface_name)
             
             info = {
                 'name': self.interface_name,
@@ -107,15 +134,19 @@ class NetworkTools:
         try:
             interfaces = []
             
+            # Take each snapshot once instead of once per interface
+            addrs_map = psutil.net_if_addrs()
+            stats_map = psutil.net_if_stats()
+            io_counters = psutil.net_io_counters(pernic=True) if include_stats else {}
+            
             # Get all interface names
-            for interface_name in psutil.net_if_addrs().keys():
+            for interface_name in addrs_map.keys():
                 try:
-                    net_info = NetworkInfo(interface_name)
+                    net_info = NetworkInfo(interface_name, stats_map, addrs_map)
                     interface_data = net_info.get_info()
                     
                     if include_stats:
                         # Add I/O statistics
-                        io_counters = psutil.net_io_counters(pernic=True)
                         if interface_name in io_counters:
                             io = io_counters[interface_name]
                             interface_data['statistics'] = {
@@ -420,26 +451,7 @@ class NetworkTools:
     
     def _identify_service(self, port: int) -> Optional[str]:
         """Identify common service by port number."""
-        common_ports = {
-            20: 'FTP-DATA',
-            21: 'FTP',
-            22: 'SSH',
-            23: 'Telnet',
-            25: 'SMTP',
-            53: 'DNS',
-            80: 'HTTP',
-            110: 'POP3',
-            143: 'IMAP',
-            443: 'HTTPS',
-            445: 'SMB',
-            3306: 'MySQL',
-            3389: 'RDP',
-            5432: 'PostgreSQL',
-            5900: 'VNC',
-            8080: 'HTTP-Proxy',
-            8443: 'HTTPS-Alt'
-        }
-        return common_ports.get(port)
+        return _COMMON_PORTS.get(port)
     
     async def get_active_connections(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Get active network connections.
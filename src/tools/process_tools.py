@@ -3,6 +3,7 @@ Process management tools for PC Control MCP Server.
 """
 
 import os
+import heapq
 import signal
 import asyncio
 from typing import Dict, Any, List, Optional, Union
@@ -33,40 +34,47 @@ class ProcessInfo:
     def get_info(self) -> Dict[str, Any]:
         """Get process information with caching."""
         try:
-            # Basic info that rarely changes
-            if 'basic' not in self._info_cache:
-                self._info_cache['basic'] = {
-                    'pid': self.process.pid,
-                    'name': self.process.name(),
-                    'exe': self.process.exe() if self.process.exe() else None,
-                    'cmdline': self.process.cmdline(),
-                    'create_time': datetime.fromtimestamp(self.process.create_time()).isoformat(),
-                    'ppid': self.process.ppid(),
-                    'status': self.process.status(),
-                    'username': self.process.username() if hasattr(self.process, 'username') else None,
-                    'cwd': self.process.cwd() if self.process.cwd() else None
-                }
-            
-            # Dynamic info
+            # Sampled outside oneshot(): the cache would freeze cpu_times
+            # across the measurement interval and always yield 0.0
             cpu_percent = self.process.cpu_percent(interval=0.1)
-            memory_info = self.process.memory_info()
             
-            return {
-                **self._info_cache['basic'],
-                'cpu_percent': cpu_percent,
-                'memory_info': {
-                    'rss': memory_info.rss,
-                    'vms': memory_info.vms,
-                    'percent': self.process.memory_percent()
-                },
-                'num_threads': self.process.num_threads(),
-                'num_fds': self.process.num_fds() if hasattr(self.process, 'num_fds') else None,
-                'io_counters': self._get_io_counters(),
-                'connections': self._get_connections(),
-                'open_files': self._get_open_files(),
-                'children': [child.pid for child in self.process.children()],
-                'nice': self.process.nice() if hasattr(self.process, 'nice') else None
-            }
+            # Batch the remaining reads so /proc/<pid>/* is parsed once
+            with self.process.oneshot():
+                # Basic info that rarely changes
+                if 'basic' not in self._info_cache:
+                    exe = self.process.exe()
+                    cwd = self.process.cwd()
+                    self._info_cache['basic'] = {
+                        'pid': self.process.pid,
+                        'name': self.process.name(),
+                        'exe': exe if exe else None,
+                        'cmdline': self.process.cmdline(),
+                        'create_time': datetime.fromtimestamp(self.process.create_time()).isoformat(),
+                        'ppid': self.process.ppid(),
+                        'status': self.process.status(),
+                        'username': self.process.username() if hasattr(self.process, 'username') else None,
+                        'cwd': cwd if cwd else None
+                    }
+                
+                # Dynamic info
+                memory_info = self.process.memory_info()
+                
+                return {
+                    **self._info_cache['basic'],
+                    'cpu_percent': cpu_percent,
+                    'memory_info': {
+                        'rss': memory_info.rss,
+                        'vms': memory_info.vms,
+                        'percent': self.process.memory_percent()
+                    },
+                    'num_threads': self.process.num_threads(),
+                    'num_fds': self.process.num_fds() if hasattr(self.process, 'num_fds') else None,
+                    'io_counters': self._get_io_counters(),
+                    'connections': self._get_connections(),
+                    'open_files': self._get_open_files(),
+                    'children': [child.pid for child in self.process.children()],
+                    'nice': self.process.nice() if hasattr(self.process, 'nice') else None
+                }
         except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess) as e:
             raise ProcessException(f"Failed to get process info: {str(e)}")
     
@@ -134,11 +142,13 @@ class ProcessTools:
                     - min_memory: Minimum memory usage (float)
                     - sort_by: Sort field (str) - cpu, memory, name, pid
                     - limit: Maximum number of results (int)
+                    - refresh: Drop psutil's cached Process objects first (bool)
         
         Returns:
             List of process information dictionaries
         """
         log.debug("Listing processes", filters=filters)
+        filters = filters or {}
         
         try:
             # Security check
@@ -146,6 +156,11 @@ class ProcessTools:
                 operation = Operation('read', 'process_list', {'filters': filters})
                 # Check authorization would be done at the server level
             
+            # process_iter() reuses Process instances between calls (psutil 6+);
+            # only rebuild them when the caller asks for a fresh snapshot
+            if filters.get('refresh') and hasattr(psutil.process_iter, 'cache_clear'):
+                psutil.process_iter.cache_clear()
+            
             # Get all processes
             processes = []
             
@@ -193,12 +208,15 @@ class ProcessTools:
             elif sort_by == 'memory':
                 sort_by = 'memory_percent'
             
-            processes.sort(key=lambda x: x.get(sort_by, 0), reverse=reverse)
+            sort_key = lambda x: x.get(sort_by, 0)
             
-            # Apply limit
-            if filters.get('limit'):
-                processes = processes[:filters['limit']]
+            # Top-K selection is O(n log k) instead of sorting everything
+            limit = filters.get('limit')
+            if limit:
+                select = heapq.nlargest if reverse else heapq.nsmallest
+                return select(limit, processes, key=sort_key)
             
+            processes.sort(key=sort_key, reverse=reverse)
             return processes
             
         except Exception as e:
@@ -490,61 +508,65 @@ class ProcessTools:
             
             process = psutil.Process(pid)
             
-            # Get CPU times
-            cpu_times = process.cpu_times()
-            
-            # Get memory info
-            memory_info = process.memory_info()
-            memory_full = process.memory_full_info() if hasattr(process, 'memory_full_info') else None
-            
-            # Get I/O counters
-            try:
-                io_counters = process.io_counters()
-                io_stats = {
-                    'read_count': io_counters.read_count,
-                    'write_count': io_counters.write_count,
-                    'read_bytes': io_counters.read_bytes,
-                    'write_bytes': io_counters.write_bytes
-                }
-            except (AttributeError, psutil.AccessDenied):
-                io_stats = None
-            
-            # Get context switches
-            try:
-                ctx_switches = process.num_ctx_switches()
-                context_switches = {
-                    'voluntary': ctx_switches.voluntary,
-                    'involuntary': ctx_switches.involuntary
-                }
-            except (AttributeError, psutil.AccessDenied):
-                context_switches = None
+            # Sampled outside oneshot(), which would freeze cpu_times
+            cpu_percent = process.cpu_percent(interval=0.1)
             
-            return {
-                'pid': pid,
-                'name': process.name(),
-                'cpu': {
-                    'percent': process.cpu_percent(interval=0.1),
-                    'times': {
-                        'user': cpu_times.user,
-                        'system': cpu_times.system,
-                        'children_user': getattr(cpu_times, 'children_user', 0),
-                        'children_system': getattr(cpu_times, 'children_system', 0)
+            with process.oneshot():
+                # Get CPU times
+                cpu_times = process.cpu_times()
+                
+                # Get memory info
+                memory_info = process.memory_info()
+                memory_full = process.memory_full_info() if hasattr(process, 'memory_full_info') else None
+                
+                # Get I/O counters
+                try:
+                    io_counters = process.io_counters()
+                    io_stats = {
+                        'read_count': io_counters.read_count,
+                        'write_count': io_counters.write_count,
+                        'read_bytes': io_counters.read_bytes,
+                        'write_bytes': io_counters.write_bytes
+                    }
+                except (AttributeError, psutil.AccessDenied):
+                    io_stats = None
+                
+                # Get context switches
+                try:
+                    ctx_switches = process.num_ctx_switches()
+                    context_switches = {
+                        'voluntary': ctx_switches.voluntary,
+                        'involuntary': ctx_switches.involuntary
+                    }
+                except (AttributeError, psutil.AccessDenied):
+                    context_switches = None
+                
+                return {
+                    'pid': pid,
+                    'name': process.name(),
+                    'cpu': {
+                        'percent': cpu_percent,
+                        'times': {
+                            'user': cpu_times.user,
+                            'system': cpu_times.system,
+                            'children_user': getattr(cpu_times, 'children_user', 0),
+                            'children_system': getattr(cpu_times, 'children_system', 0)
+                        },
+                        'affinity': process.cpu_affinity() if hasattr(process, 'cpu_affinity') else None
                     },
-                    'affinity': process.cpu_affinity() if hasattr(process, 'cpu_affinity') else None
-                },
-                'memory': {
-                    'rss': memory_info.rss,
-                    'vms': memory_info.vms,
-                    'percent': process.memory_percent(),
-                    'uss': memory_full.uss if memory_full else None,
-                    'pss': memory_full.pss if memory_full else None
-                },
-                'io': io_stats,
-                'context_switches': context_switches,
-                'num_threads': process.num_threads(),
-                'num_fds': process.num_fds() if hasattr(process, 'num_fds') else None,
-                'nice_priority': process.nice() if hasattr(process, 'nice') else None
-            }
+                    'memory': {
+                        'rss': memory_info.rss,
+                        'vms': memory_info.vms,
+                        'percent': process.memory_percent(),
+                        'uss': memory_full.uss if memory_full else None,
+                        'pss': memory_full.pss if memory_full else None
+                    },
+                    'io': io_stats,
+                    'context_switches': context_switches,
+                    'num_threads': process.num_threads(),
+                    'num_fds': process.num_fds() if hasattr(process, 'num_fds') else None,
+                    'nice_priority': process.nice() if hasattr(process, 'nice') else None
+                }
             
         except psutil.NoSuchProcess:
             raise ProcessException(f"Process with PID {pid} not found")
@@ -20,6 +20,23 @@ from ..utils.platform_utils import is_windows, is_linux, is_macos, is_admin
 
 log = StructuredLogger(__name__)
 
+# PowerShell Get-Service status (lower-cased) -> reported status
+_WINDOWS_STATUS_MAP = {
+    'running': 'running',
+    'stopped': 'stopped',
+    'paused': 'paused',
+    'startpending': 'starting',
+    'stoppending': 'stopping'
+}
+
+# Startup type -> sc.exe "start=" value
+_SC_STARTUP_TYPES = {
+    'auto': 'auto',
+    'automatic': 'auto',
+    'manual': 'demand',
+    'disabled': 'disabled'
+}
+
 
 class ServiceInfo:
     """Service information container."""
@@ -120,14 +137,7 @@ class ServiceTools:
                     }
                     
                     # Map status values
-                    status_map = {
-                        'running': 'running',
-                        'stopped': 'stopped',
-                        'paused': 'paused',
-                        'startpending': 'starting',
-                        'stoppending': 'stopping'
-                    }
-                    service_info['status'] = status_map.get(
+                    service_info['status'] = _WINDOWS_STATUS_MAP.get(
                         service_info['status'], 
                         service_info['status']
                     )
@@ -478,7 +488,7 @@ class ServiceTools:
                     elif 'pid =' in line:
                         try:
                             info['pid'] = int(line.split('=')[1].strip())
-                        except:
+                        except (IndexError, ValueError):
                             pass
                 
                 return info
@@ -826,15 +836,7 @@ class ServiceTools:
     async def _set_windows_service_startup(self, service_name: str, 
                                          startup_type: str) -> Dict[str, Any]:
         """Set Windows service startup type."""
-        # Map startup types
-        type_map = {
-            'auto': 'auto',
-            'automatic': 'auto',
-            'manual': 'demand',
-            'disabled': 'disabled'
-        }
-        
-        sc_type = type_map[startup_type.lower()]
+        sc_type = _SC_STARTUP_TYPES[startup_type.lower()]
         
         process = await asyncio.create_subprocess_exec(
             'sc', 'config', service_name, 'start=', sc_type,
@@ -4,7 +4,11 @@ System information and monitoring tools for PC Control MCP Server.
 
 import os
 import sys
+import copy
+import functools
 import platform
+import shlex
+import shutil
 import socket
 import subprocess
 import asyncio
@@ -25,11 +29,99 @@ from ..utils.platform_utils import (
     is_windows, 
     is_linux,
     is_macos,
+    get_cpu_percent,
     get_system_info as get_basic_system_info
 )
 
 log = StructuredLogger(__name__)
 
+# Characters that need a real shell (expansion, redirection, chaining, ...)
+_POSIX_SHELL_METACHARS = frozenset(';|&$`<>*?~(){}[]!#\n\r')
+_WINDOWS_SHELL_METACHARS = frozenset(';|&<>^%!()\"\'\n\r')
+
+
+async def _drain(process: asyncio.subprocess.Process, stream: asyncio.StreamReader,
+                 buffer: bytearray, limit: int) -> bool:
+    """Read a subprocess stream into buffer, killing the process past limit.
+    
+    Args:
+        process: Process owning the stream
+        stream: stdout or stderr reader
+        buffer: Buffer to append output to
+        limit: Maximum number of bytes to keep
+        
+    Returns:
+        True if the output was truncated
+    """
+    while True:
+        chunk = await stream.read(65536)
+        if not chunk:
+            return False
+        remaining = limit - len(buffer)
+        if len(chunk) > remaining:
+            buffer += chunk[:remaining]
+            if process.returncode is None:
+                process.kill()
+            return True
+        buffer += chunk
+
+
+@functools.lru_cache(maxsize=None)
+def _get_static_os_info() -> Dict[str, Any]:
+    """Collect OS/platform facts that cannot change while the server runs.
+    
+    platform.processor()/uname() may fork on some systems and the Linux
+    distribution lookup reads /etc/os-release, so this runs once per process.
+    """
+    os_info = {
+        'system': platform.system(),
+        'release': platform.release(),
+        'version': platform.version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'node': platform.node()
+    }
+    
+    # Add distribution info for Linux
+    if is_linux():
+        try:
+            import distro
+            os_info['distribution'] = {
+                'name': distro.name(),
+                'version': distro.version(),
+                'codename': distro.codename()
+            }
+        except ImportError:
+            # Try to read from os-release
+            try:
+                with open('/etc/os-release', 'r') as f:
+                    os_release = {}
+                    for line in f:
+                        if '=' in line:
+                            key, value = line.strip().split('=', 1)
+                            os_release[key] = value.strip('"')
+                    os_info['distribution'] = {
+                        'name': os_release.get('NAME', 'Unknown'),
+                        'version': os_release.get('VERSION_ID', 'Unknown')
+                    }
+            except Exception:
+                pass
+    
+    # Add Windows-specific info
+    elif is_windows():
+        os_info['windows'] = {
+            'edition': platform.win32_edition() if hasattr(platform, 'win32_edition') else None,
+            'version': platform.win32_ver()[1]
+        }
+    
+    # Add macOS-specific info
+    elif is_macos():
+        os_info['macos'] = {
+            'version': platform.mac_ver()[0]
+        }
+    
+    return os_info
+
 
 class SystemTools:
     """System information and monitoring tools."""
@@ -37,6 +129,67 @@ class SystemTools:
     def __init__(self, security_manager: Optional[SecurityManager] = None):
         self.security = security_manager
         self.config = get_config()
+        
+        # Command parsing rules for this platform, resolved once
+        self._posix_split = os.name != 'nt'
+        self._shell_metachars = _POSIX_SHELL_METACHARS if self._posix_split else _WINDOWS_SHELL_METACHARS
+        
+        # Allowed programs for shell-less execution (normcase: case-insensitive on Windows)
+        self._allowed_commands = frozenset(
+            os.path.normcase(c)
+            for c in self.config.get('security.authorization.allowed_commands', []) or []
+        )
+        
+        # Latest CPU utilisation from the background sampler
+        self._cpu_percent: Optional[float] = None
+        self._cpu_percent_per_core: Optional[List[float]] = None
+        self._cpu_sampler_task: Optional[asyncio.Task] = None
+        
+        # Prime psutil's CPU counters so the first non-blocking read is
+        # meaningful (and start the Windows load-average emulation thread)
+        get_cpu_percent()
+        if hasattr(psutil, 'getloadavg'):
+            psutil.getloadavg()
+        
+        # info_type -> handler, built once instead of an if/elif chain per call
+        self._info_handlers = {
+            'basic': self._get_basic_info,
+            'cpu': self._get_cpu_info,
+            'memory': self._get_memory_info,
+            'disk': self._get_disk_info,
+            'network': self._get_network_info,
+        }
+    
+    def start_cpu_sampler(self, interval: float = 1.0):
+        """Start sampling CPU utilisation in the background.
+        
+        Must be called from a running event loop. While the sampler runs,
+        CPU queries return the latest sample instead of measuring inline.
+        
+        Args:
+            interval: Seconds between samples
+        """
+        if self._cpu_sampler_task is None or self._cpu_sampler_task.done():
+            self._cpu_sampler_task = asyncio.get_running_loop().create_task(
+                self._cpu_sampler(interval)
+            )
+    
+    def stop_cpu_sampler(self):
+        """Stop the background CPU sampler and drop its cached values."""
+        if self._cpu_sampler_task is not None:
+            self._cpu_sampler_task.cancel()
+            self._cpu_sampler_task = None
+        self._cpu_percent = None
+        self._cpu_percent_per_core = None
+    
+    async def _cpu_sampler(self, interval: float):
+        """Refresh cached CPU percentages every interval seconds."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                self._cpu_percent, self._cpu_percent_per_core = get_cpu_percent()
+            except Exception as e:
+                log.debug(f"CPU sampling failed: {e}")
     
     async def get_system_info(self, info_type: Optional[str] = None) -> Dict[str, Any]:
         """Get system information.
@@ -62,27 +215,18 @@ class SystemTools:
             
             info_type = info_type or 'all'
             
-            if info_type == 'basic':
-                return await self._get_basic_info()
-            elif info_type == 'cpu':
-                return await self._get_cpu_info()
-            elif info_type == 'memory':
-                return await self._get_memory_info()
-            elif info_type == 'disk':
-                return await self._get_disk_info()
-            elif info_type == 'network':
-                return await self._get_network_info()
-            elif info_type == 'all':
-                return {
-                    'basic': await self._get_basic_info(),
-                    'cpu': await self._get_cpu_info(),
-                    'memory': await self._get_memory_info(),
-                    'disk': await self._get_disk_info(),
-                    'network': await self._get_network_info(),
-                    'timestamp': datetime.now(timezone.utc).isoformat()
-                }
-            else:
-                raise ValueError(f"Unknown info_type: {info_type}")
+            handler = self._info_handlers.get(info_type)
+            if handler:
+                return await handler()
+            
+            if info_type == 'all':
+                result = {}
+                for key, section_handler in self._info_handlers.items():
+                    result[key] = await section_handler()
+                result['timestamp'] = datetime.now(timezone.utc).isoformat()
+                return result
+            
+            raise ValueError(f"Unknown info_type: {info_type}")
                 
         except Exception as e:
             log.error(f"Failed to get system info: {e}", exception=e)
@@ -123,11 +267,17 @@ class SystemTools:
         # Get CPU frequencies
         cpu_freq = psutil.cpu_freq()
         
+        # Use the sampler's cached values when available
+        cpu_percent = self._cpu_percent
+        cpu_percent_per_core = self._cpu_percent_per_core
+        if cpu_percent is None:
+            cpu_percent, cpu_percent_per_core = get_cpu_percent()
+        
         return {
             'physical_cores': psutil.cpu_count(logical=False),
             'logical_cores': psutil.cpu_count(logical=True),
-            'cpu_percent': psutil.cpu_percent(interval=0),
-            'cpu_percent_per_core': psutil.cpu_percent(interval=0, percpu=True),
+            'cpu_percent': cpu_percent,
+            'cpu_percent_per_core': cpu_percent_per_core,
             'cpu_frequency': {
                 'current': cpu_freq.current if cpu_freq else None,
                 'min': cpu_freq.min if cpu_freq else None,
@@ -135,7 +285,7 @@ class SystemTools:
             } if cpu_freq else None,
             'cpu_times': psutil.cpu_times()._asdict(),
             'cpu_stats': psutil.cpu_stats()._asdict() if hasattr(psutil, 'cpu_stats') else None,
-            'load_average': os.getloadavg() if hasattr(os, 'getloadavg') else None
+            'load_average': psutil.getloadavg() if hasattr(psutil, 'getloadavg') else None
         }
     
     async def _get_memory_info(self) -> Dict[str, Any]:
@@ -397,55 +547,7 @@ class SystemTools:
     async def get_os_info(self) -> Dict[str, Any]:
         """Get operating system information."""
         try:
-            os_info = {
-                'system': platform.system(),
-                'release': platform.release(),
-                'version': platform.version(),
-                'platform': platform.platform(),
-                'machine': platform.machine(),
-                'node': platform.node()
-            }
-            
-            # Add distribution info for Linux
-            if is_linux():
-                try:
-                    import distro
-                    os_info['distribution'] = {
-                        'name': distro.name(),
-                        'version': distro.version(),
-                        'codename': distro.codename()
-                    }
-                except ImportError:
-                    # Try to read from os-release
-                    try:
-                        with open('/etc/os-release', 'r') as f:
-                            os_release = {}
-                            for line in f:
-                                if '=' in line:
-                                    key, value = line.strip().split('=', 1)
-                                    os_release[key] = value.strip('"')
-                            os_info['distribution'] = {
-                                'name': os_release.get('NAME', 'Unknown'),
-                                'version': os_release.get('VERSION_ID', 'Unknown')
-                            }
-                    except Exception:
-                        pass
-            
-            # Add Windows-specific info
-            elif is_windows():
-                os_info['windows'] = {
-                    'edition': platform.win32_edition() if hasattr(platform, 'win32_edition') else None,
-                    'version': platform.win32_ver()[1]
-                }
-            
-            # Add macOS-specific info
-            elif is_macos():
-                os_info['macos'] = {
-                    'version': platform.mac_ver()[0]
-                }
-            
-            return os_info
-            
+            return copy.deepcopy(_get_static_os_info())
         except Exception as e:
             log.error(f"Failed to get OS info: {e}", exception=e)
             raise SystemException(f"Failed to get OS info: {str(e)}")
@@ -509,6 +611,56 @@ class SystemTools:
             log.error(f"Failed to get system uptime: {e}", exception=e)
             raise SystemException(f"Failed to get system uptime: {str(e)}")
     
+    def _direct_exec_args(self, command: str,
+                          working_directory: Optional[str] = None) -> Optional[List[str]]:
+        """Return argv for running a shell command without the shell.
+        
+        Only plain invocations qualify: no shell metacharacters, and the
+        program must be a bare name that resolves to an executable on PATH
+        (so shell builtins such as cd/dir/echo, and relative programs such
+        as ./build.sh, keep going through the shell). When allowed_commands
+        is configured the program must also be listed there.
+        
+        Args:
+            command: Command line to run
+            working_directory: Directory the command will run in
+        
+        Returns:
+            Argument list, or None if the shell is required
+        """
+        if not self._shell_metachars.isdisjoint(command):
+            return None
+        
+        try:
+            args = shlex.split(command, posix=self._posix_split)
+        except ValueError:
+            return None
+        if not args:
+            return None
+        
+        if self._allowed_commands and os.path.normcase(args[0]) not in self._allowed_commands:
+            return None
+        
+        # Programs with a directory part resolve against working_directory in
+        # the shell, while shutil.which would use the server's cwd
+        if os.path.dirname(args[0]):
+            return None
+        
+        program = shutil.which(args[0])
+        if not program:
+            return None
+        
+        if not self._posix_split:
+            # cmd.exe looks in the current directory before PATH, and which()
+            # does the same with the server's cwd; leave both cases to the shell
+            cwd = working_directory or os.getcwd()
+            extensions = [''] + os.environ.get('PATHEXT', '').split(os.pathsep)
+            if any(os.path.isfile(os.path.join(cwd, args[0] + ext)) for ext in extensions):
+                return None
+            if os.path.normcase(os.path.dirname(os.path.abspath(program))) == os.path.normcase(os.getcwd()):
+                return None
+        return [program] + args[1:]
+    
     async def execute_command(self, command: str, shell: bool = True, 
                             timeout: Optional[int] = None,
                             working_directory: Optional[str] = None) -> Dict[str, Any]:
@@ -541,7 +693,16 @@ class SystemTools:
                 timeout = self.config.get('security.authorization.command_timeout', 30)
             
             # Execute command (prefer exec without shell when possible)
-            if shell:
+            direct_args = self._direct_exec_args(validated_command, working_directory) if shell else None
+            if direct_args:
+                # Plain program invocation: skip the extra shell process
+                process = await asyncio.create_subprocess_exec(
+                    *direct_args,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    cwd=working_directory
+                )
+            elif shell:
                 process = await asyncio.create_subprocess_shell(
                     validated_command,
                     stdout=asyncio.subprocess.PIPE,
@@ -549,9 +710,8 @@ class SystemTools:
                     cwd=working_directory
                 )
             else:
-                import shlex
                 # Windows needs posix=False for proper splitting
-                args = shlex.split(validated_command, posix=(os.name != 'nt'))
+                args = shlex.split(validated_command, posix=self._posix_split)
                 if not args:
                     raise SystemException("Empty command after parsing")
                 process = await asyncio.create_subprocess_exec(
@@ -561,22 +721,35 @@ class SystemTools:
                     cwd=working_directory
                 )
             
-            try:
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(),
-                    timeout=timeout
+            # Stream output incrementally, capped at max_file_size per stream
+            output_limit = self.config.get('file_operations.max_file_size', 104857600)
+            stdout_buf = bytearray()
+            stderr_buf = bytearray()
+            
+            async def drain_and_wait():
+                truncated = await asyncio.gather(
+                    _drain(process, process.stdout, stdout_buf, output_limit),
+                    _drain(process, process.stderr, stderr_buf, output_limit)
                 )
+                await process.wait()
+                return truncated
+            
+            try:
+                # One timeout covers both draining the pipes and waiting for exit
+                truncated = await asyncio.wait_for(drain_and_wait(), timeout=timeout)
             except asyncio.TimeoutError:
-                process.kill()
+                if process.returncode is None:
+                    process.kill()
                 await process.wait()
                 raise TimeoutException(f"Command timed out after {timeout} seconds")
             
             return {
                 'command': validated_command,
                 'return_code': process.returncode,
-                'stdout': stdout.decode('utf-8', errors='replace'),
-                'stderr': stderr.decode('utf-8', errors='replace'),
-                'success': process.returncode == 0
+                'stdout': stdout_buf.decode('utf-8', errors='replace'),
+                'stderr': stderr_buf.decode('utf-8', errors='replace'),
+                'truncated': any(truncated),
+                'success': process.returncode == 0 and not any(truncated)
             }
             
         except TimeoutException:
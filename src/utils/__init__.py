@@ -22,11 +22,13 @@ from .platform_utils import (
     get_line_separator,
     supports_color,
     get_cpu_count,
+    get_cpu_percent,
     get_memory_page_size,
     ensure_directory,
     safe_remove,
     get_startup_directory
 )
+from .executors import get_io_executor, shutdown_io_executor
 
 __all__ = [
     'get_platform',
@@ -48,8 +50,11 @@ __all__ = [
     'get_line_separator',
     'supports_color',
     'get_cpu_count',
+    'get_cpu_percent',
     'get_memory_page_size',
     'ensure_directory',
     'safe_remove',
-    'get_startup_directory'
+    'get_startup_directory',
+    'get_io_executor',
+    'shutdown_io_executor'
 ]
\ No newline at end of file
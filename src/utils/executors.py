@@ -0,0 +1,29 @@
+"""
+Shared thread pools for PC Control MCP Server.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+# One pool for blocking filesystem/encode work across all tool classes
+_io_executor: Optional[ThreadPoolExecutor] = None
+_io_executor_lock = threading.Lock()
+
+
+def get_io_executor() -> ThreadPoolExecutor:
+    """Get the process-wide I/O pool, creating it on first use."""
+    global _io_executor
+    with _io_executor_lock:
+        if _io_executor is None:
+            _io_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="pcmcp-io")
+        return _io_executor
+
+
+def shutdown_io_executor(wait: bool = True):
+    """Shut down the I/O pool; a later get_io_executor() starts a new one."""
+    global _io_executor
+    with _io_executor_lock:
+        executor, _io_executor = _io_executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
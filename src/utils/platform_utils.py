@@ -5,13 +5,23 @@ Platform-specific utilities for PC Control MCP Server.
 import sys
 import platform
 import os
-from typing import Dict, Any, Optional, List
+import threading
+import time
+from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
+import psutil
 
 from ..core import StructuredLogger
 
 log = StructuredLogger(__name__)
 
+# Last (monotonic time, total percent, per-core percents) CPU sample.
+# psutil.cpu_percent(interval=None) measures against a module-global
+# baseline, so every caller in the process goes through get_cpu_percent
+# instead of calling it directly and shortening the others' window.
+_cpu_sample: Optional[Tuple[float, float, List[float]]] = None
+_cpu_sample_lock = threading.Lock()
+
 
 def get_platform() -> str:
     """Get current platform identifier.
@@ -188,6 +198,29 @@ def get_cpu_count() -> int:
     return os.cpu_count() or 1
 
 
+def get_cpu_percent(max_age: float = 0.5) -> Tuple[float, List[float]]:
+    """Get CPU utilisation from the process-wide shared sample.
+    
+    Args:
+        max_age: Seconds a previous sample is reused before measuring again
+        
+    Returns:
+        Tuple of (total percent, per-core percents)
+    """
+    global _cpu_sample
+    with _cpu_sample_lock:
+        now = time.monotonic()
+        if _cpu_sample is None or now - _cpu_sample[0] >= max_age:
+            # The very first reading only primes psutil's baseline, so it
+            # is never reused: the next call measures again
+            _cpu_sample = (
+                now if _cpu_sample is not None else float('-inf'),
+                psutil.cpu_percent(interval=None),
+                psutil.cpu_percent(interval=None, percpu=True),
+            )
+        return _cpu_sample[1], _cpu_sample[2]
+
+
 def get_memory_page_size() -> int:
     """Get system memory page size."""
     try:
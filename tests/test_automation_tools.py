@@ -0,0 +1,75 @@
+"""
+Tests for src.tools.automation_tools.
+"""
+
+import sys
+import types
+
+import pytest
+
+try:
+    from src.tools import automation_tools
+except Exception as e:  # pyautogui raises non-ImportErrors without a display
+    pytest.skip(f"automation_tools unavailable: {e}", allow_module_level=True)
+
+
+@pytest.fixture
+def fake_quartz(monkeypatch):
+    """Replace Quartz with a recorder of the Unicode strings posted."""
+    posted = []
+    quartz = types.ModuleType('Quartz')
+    quartz.kCGHIDEventTap = 0
+    quartz.CGEventCreateKeyboardEvent = lambda source, keycode, key_down: {
+        'keycode': keycode, 'down': key_down, 'text': None
+    }
+    
+    def set_unicode_string(event, length, text):
+        assert len(text.encode('utf-16-le')) // 2 == length
+        event['text'] = text
+    
+    quartz.CGEventKeyboardSetUnicodeString = set_unicode_string
+    quartz.CGEventPost = lambda tap, event: posted.append(event)
+    monkeypatch.setitem(sys.modules, 'Quartz', quartz)
+    return posted
+
+
+def _typed_text(posted):
+    return ''.join(event['text'] for event in posted if event['down'] and event['text'] is not None)
+
+
+def test_post_unicode_events_astral_char_on_chunk_boundary(fake_quartz):
+    # 19 BMP units followed by an emoji: its surrogate pair straddles the
+    # 20-unit (40-byte) chunk boundary
+    text = 'a' * 19 + '\U0001F600' + 'b' * 25
+    automation_tools._post_unicode_events(text)
+    
+    assert _typed_text(fake_quartz) == text
+    for event in fake_quartz:
+        if event['text'] is not None:
+            assert len(event['text'].encode('utf-16-le')) <= 40
+
+
+def test_post_unicode_events_sends_newline_and_tab_as_keys(fake_quartz):
+    automation_tools._post_unicode_events('a\r\nb\tc')
+    
+    keycodes = [event['keycode'] for event in fake_quartz if event['down'] and event['text'] is None]
+    assert keycodes == [0x24, 0x30]
+    assert _typed_text(fake_quartz) == 'abc'
+
+
+def test_save_image_writes_png_at_compress_level_6(tmp_path, monkeypatch):
+    saved = []
+    original_save = automation_tools.Image.Image.save
+    
+    def recording_save(image, fp, format=None, **params):
+        saved.append(params)
+        return original_save(image, fp, format, **params)
+    
+    monkeypatch.setattr(automation_tools.Image.Image, 'save', recording_save)
+    image = automation_tools.Image.new('RGB', (8, 8), 'red')
+    path = tmp_path / "shot.png"
+    
+    automation_tools.AutomationTools()._save_image(image, str(path))
+    
+    assert saved == [{'compress_level': 6}]
+    assert automation_tools.Image.open(path).size == (8, 8)
@@ -0,0 +1,63 @@
+"""
+Tests for src.core.config.
+"""
+
+import pytest
+
+from src.core import config
+from src.core.config import ConfigManager
+
+
+@pytest.fixture(autouse=True)
+def clear_default_config_path(monkeypatch):
+    monkeypatch.delenv('PC_CONTROL_CONFIG_PATH', raising=False)
+    config._clear_default_config_path()
+    yield
+    config._clear_default_config_path()
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    monkeypatch.delenv('PC_CONTROL_LOG_LEVEL', raising=False)
+    path = tmp_path / "config.yaml"
+    path.write_text("server:\n  log_level: INFO\n")
+    return path
+
+
+def test_reload_reapplies_env_overrides_when_file_unchanged(config_file, monkeypatch):
+    manager = ConfigManager(config_file)
+    assert manager.get('server.log_level') == 'INFO'
+    
+    monkeypatch.setenv('PC_CONTROL_LOG_LEVEL', 'DEBUG')
+    manager.reload()
+    
+    assert manager.get('server.log_level') == 'DEBUG'
+
+
+def test_reload_discards_runtime_edits_when_file_unchanged(config_file):
+    manager = ConfigManager(config_file)
+    manager.config.server.log_level = 'ERROR'
+    
+    manager.reload()
+    
+    assert manager.get('server.log_level') == 'INFO'
+
+
+def test_default_config_path_is_cached_absolute(tmp_path, monkeypatch):
+    (tmp_path / "config").mkdir()
+    (tmp_path / "config" / "default.yaml").write_text("server:\n  log_level: WARNING\n")
+    monkeypatch.chdir(tmp_path)
+    
+    manager = ConfigManager()
+    assert manager.config_path == tmp_path.resolve() / "config" / "default.yaml"
+    
+    monkeypatch.chdir(tmp_path.parent)
+    assert ConfigManager().config_path.exists()
+
+
+def test_explicit_config_path_is_absolute(config_file, monkeypatch):
+    monkeypatch.chdir(config_file.parent)
+    
+    manager = ConfigManager(config_file.name)
+    
+    assert manager.config_path == config_file.resolve()
@@ -0,0 +1,28 @@
+"""
+Tests for src.core.exceptions.
+"""
+
+import copy
+import pickle
+
+from src.core.exceptions import RateLimitException, ValidationException
+
+
+def test_exception_fields_survive_pickle():
+    exc = RateLimitException("slow down", retry_after=30, details={"k": 1})
+    
+    restored = pickle.loads(pickle.dumps(exc))
+    
+    assert type(restored) is RateLimitException
+    assert restored.message == "slow down"
+    assert restored.retry_after == 30
+    assert restored.details == {"k": 1}
+
+
+def test_exception_fields_survive_copy():
+    exc = ValidationException("bad input", details={"field": "path"})
+    
+    restored = copy.copy(exc)
+    
+    assert restored.message == "bad input"
+    assert restored.details == {"field": "path"}
@@ -0,0 +1,18 @@
+"""
+Tests for src.utils.executors.
+"""
+
+from src.utils.executors import get_io_executor, shutdown_io_executor
+
+
+def test_io_executor_is_shared_and_restartable():
+    executor = get_io_executor()
+    assert get_io_executor() is executor
+    assert executor.submit(lambda: 42).result() == 42
+    
+    shutdown_io_executor()
+    
+    restarted = get_io_executor()
+    assert restarted is not executor
+    assert restarted.submit(lambda: 7).result() == 7
+    shutdown_io_executor()
@@ -0,0 +1,36 @@
+"""
+Tests for src.tools.file_tools.
+"""
+
+import asyncio
+import os
+import stat
+import sys
+
+import pytest
+
+from src.tools.file_tools import FileTools
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason="POSIX permission bits")
+@pytest.mark.parametrize("preserve_metadata", [True, False])
+def test_copy_file_keeps_permission_bits(tmp_path, preserve_metadata):
+    source = tmp_path / "run.sh"
+    source.write_text("#!/bin/sh\n")
+    source.chmod(0o750)
+    destination = tmp_path / "copy.sh"
+    
+    asyncio.run(FileTools().copy_file(str(source), str(destination),
+                                      preserve_metadata=preserve_metadata))
+    
+    assert stat.S_IMODE(os.stat(destination).st_mode) == 0o750
+
+
+@pytest.mark.parametrize("linesep", ["\n", "\r\n"])
+def test_write_file_uses_platform_line_endings(tmp_path, monkeypatch, linesep):
+    monkeypatch.setattr(os, 'linesep', linesep)
+    path = tmp_path / "notes.txt"
+    
+    asyncio.run(FileTools().write_file(str(path), "one\ntwo\n"))
+    
+    assert path.read_bytes() == f"one{linesep}two{linesep}".encode()
@@ -0,0 +1,30 @@
+"""
+Tests for src.monitoring.metrics_collector.
+"""
+
+from datetime import datetime
+
+from src.monitoring.metrics_collector import Metric
+
+
+def test_export_history_matches_metric_point_to_dict():
+    metric = Metric("test.metric", max_history=4)
+    for offset, value in enumerate([1.0, 2.0, 3.0]):
+        metric.add_point(value, 1_700_000_000.123456 + offset)
+    
+    exported = metric.export_history()
+    points = [point.to_dict() for point in metric.get_history()]
+    
+    assert exported == points
+    for entry in exported:
+        assert datetime.fromisoformat(entry['datetime']).utcoffset().total_seconds() == 0
+
+
+def test_ring_buffer_keeps_latest_points_in_order():
+    metric = Metric("test.metric", max_history=3)
+    for value in range(5):
+        metric.add_point(float(value), 1_700_000_000.0 + value)
+    
+    assert [point.value for point in metric.get_history()] == [2.0, 3.0, 4.0]
+    stats = metric.get_stats()
+    assert (stats['min'], stats['max']) == (2.0, 4.0)
@@ -0,0 +1,17 @@
+"""
+Tests for the lazy exports of the src package.
+"""
+
+import src
+from src.tools import _is_available
+
+
+def test_all_lists_optional_tools_with_their_requirements_installed():
+    for name in src._OPTIONAL:
+        assert (name in src.__all__) == _is_available(name)
+
+
+def test_all_lists_every_required_export():
+    required = set(src._LAZY) - src._OPTIONAL
+    assert required <= set(src.__all__)
+    assert {'__version__', '__author__'} <= set(src.__all__)
@@ -0,0 +1,30 @@
+"""
+Tests for src.tools.process_tools.
+"""
+
+import asyncio
+
+import pytest
+
+from src.tools.process_tools import ProcessTools
+
+
+def _list(filters):
+    return asyncio.run(ProcessTools().list_processes(filters))
+
+
+@pytest.mark.parametrize("sort_by, key, descending", [
+    ('pid', 'pid', False),
+    ('cpu', 'cpu_percent', False),
+    ('memory', 'memory_percent', False),
+    ('cpu_percent', 'cpu_percent', True),
+    ('memory_percent', 'memory_percent', True),
+])
+@pytest.mark.parametrize("limit", [None, 5])
+def test_list_processes_sort_direction(sort_by, key, descending, limit):
+    processes = _list({'sort_by': sort_by, 'limit': limit})
+    
+    values = [process.get(key) or 0 for process in processes]
+    assert values == sorted(values, reverse=descending)
+    if limit:
+        assert len(processes) <= limit
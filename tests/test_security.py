@@ -0,0 +1,140 @@
+"""
+Tests for src.core.security.
+"""
+
+import asyncio
+import os
+
+import pytest
+
+from src.core import security
+from src.core.config import SecurityConfig
+from src.core.security import InputValidator, RateLimiter, SecurityManager, User
+
+
+@pytest.fixture
+def security_manager():
+    config = SecurityConfig()
+    config.authentication.type = "token"
+    return SecurityManager(config)
+
+
+def _authenticate(manager, token):
+    return asyncio.run(manager.authenticate({"token": token}))
+
+
+def test_revoked_token_no_longer_authenticates(security_manager):
+    token = security_manager.create_token(User("alice", roles=["user"]))
+    assert _authenticate(security_manager, token).success
+    
+    security_manager.revoke_token(token)
+    
+    result = _authenticate(security_manager, token)
+    assert not result.success
+    assert result.error == "Token revoked"
+
+
+def test_revoke_only_affects_that_token(security_manager):
+    revoked = security_manager.create_token(User("alice"))
+    kept = security_manager.create_token(User("bob"))
+    
+    security_manager.revoke_token(revoked)
+    security_manager.revoke_token("not-a-jwt")
+    
+    assert _authenticate(security_manager, kept).success
+    assert "not-a-jwt" not in security_manager._revoked_tokens
+
+
+class _Clock:
+    """Stand-in for the time module with a settable time()."""
+    
+    def __init__(self, now: float):
+        self.now = now
+    
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock(2000.0)
+    monkeypatch.setattr(security, "time", clock)
+    return clock
+
+
+def test_rate_limit_retry_after_when_window_is_full(clock):
+    limiter = RateLimiter()
+    for _ in range(5):
+        assert limiter.check_rate_limit("client", 5, 10) == (True, None)
+    
+    clock.now = 2009.0
+    allowed, retry_after = limiter.check_rate_limit("client", 5, 10)
+    assert not allowed
+    
+    # The full window still weighs in right after the boundary
+    clock.now = 2010.0
+    assert not limiter.check_rate_limit("client", 5, 10)[0]
+    
+    clock.now = 2009.0 + retry_after
+    assert limiter.check_rate_limit("client", 5, 10)[0]
+
+
+def test_rate_limit_retry_after_while_previous_window_slides_out(clock):
+    limiter = RateLimiter()
+    for _ in range(5):
+        limiter.check_rate_limit("client", 5, 10)
+    
+    clock.now = 2010.5
+    assert limiter.check_rate_limit("client", 5, 10)[0]
+    clock.now = 2010.6
+    allowed, retry_after = limiter.check_rate_limit("client", 5, 10)
+    assert not allowed
+    
+    clock.now = 2010.6 + retry_after - 1
+    assert not limiter.check_rate_limit("client", 5, 10)[0]
+    clock.now = 2010.6 + retry_after
+    assert limiter.check_rate_limit("client", 5, 10)[0]
+
+
+@pytest.mark.parametrize("path", ["..", "../etc/passwd", "C:..\\x", "a/.. /b", "a/.../b", "a\\..\\b"])
+def test_validate_path_rejects_traversal(path):
+    result = InputValidator.validate_path(path)
+    assert not result["valid"]
+    assert result["errors"] == ["Path traversal detected"]
+
+
+def test_validate_path_rejects_null_byte():
+    result = InputValidator.validate_path("a\x00b")
+    assert result["errors"] == ["Null byte in path"]
+
+
+@pytest.mark.parametrize("path", ["a..b", "file..txt", "dir/..hidden", "v1.. /x"])
+def test_validate_path_allows_dots_inside_names(path):
+    assert InputValidator.validate_path(path)["valid"]
+
+
+def test_close_shuts_down_hash_pool(security_manager):
+    security_manager.close()
+    
+    with pytest.raises(RuntimeError):
+        asyncio.run(security_manager.hash_password("secret"))
+
+
+@pytest.mark.skipif(not hasattr(os, 'symlink'), reason="needs symlinks")
+def test_check_path_access_follows_symlink_changes(tmp_path):
+    blocked = tmp_path / "blocked"
+    public = tmp_path / "public"
+    blocked.mkdir()
+    public.mkdir()
+    link = tmp_path / "link"
+    link.symlink_to(public, target_is_directory=True)
+    
+    config = SecurityConfig()
+    config.authorization.blocked_paths = [str(blocked.resolve())]
+    manager = SecurityManager(config)
+    assert manager.check_path_access(str(link / "file.txt"))
+    
+    # Re-pointing the link must not reuse the earlier resolution
+    link.unlink()
+    link.symlink_to(blocked, target_is_directory=True)
+    assert not manager.check_path_access(str(link / "file.txt"))
@@ -0,0 +1,92 @@
+"""
+Tests for src.tools.system_tools.
+"""
+
+import asyncio
+import os
+import shutil
+import sys
+import time
+
+import pytest
+
+from src.core.exceptions import TimeoutException
+from src.tools.system_tools import SystemTools
+from src.utils import platform_utils
+
+
+@pytest.fixture
+def system_tools():
+    return SystemTools()
+
+
+@pytest.mark.parametrize("command", ["./build.sh", "bin/tool --flag"])
+def test_direct_exec_leaves_relative_programs_to_the_shell(system_tools, command, tmp_path, monkeypatch):
+    # Present and executable in the server's cwd, which must not matter
+    for name in ("build.sh", "bin/tool"):
+        program = tmp_path / name
+        program.parent.mkdir(exist_ok=True)
+        program.write_text("#!/bin/sh\n")
+        program.chmod(0o755)
+    monkeypatch.chdir(tmp_path)
+    
+    assert system_tools._direct_exec_args(command) is None
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason="POSIX shell command")
+def test_direct_exec_resolves_bare_names_on_path(system_tools):
+    assert system_tools._direct_exec_args("ls -l") == [shutil.which("ls"), "-l"]
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason="POSIX shell script")
+def test_relative_program_runs_from_working_directory(system_tools, tmp_path):
+    script = tmp_path / "hello.sh"
+    script.write_text("#!/bin/sh\necho hello\n")
+    script.chmod(0o755)
+    
+    result = asyncio.run(system_tools.execute_command("./hello.sh", working_directory=str(tmp_path)))
+    
+    assert result['success']
+    assert result['stdout'].strip() == "hello"
+    assert os.getcwd() != str(tmp_path)
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason="POSIX shell command")
+def test_timeout_covers_process_that_closes_its_pipes(system_tools):
+    started = time.monotonic()
+    
+    with pytest.raises(TimeoutException):
+        asyncio.run(system_tools.execute_command("exec >&- 2>&-; sleep 10", timeout=1))
+    
+    assert time.monotonic() - started < 5
+
+
+def test_stop_cpu_sampler_drops_cached_values(system_tools):
+    async def run_sampler():
+        system_tools.start_cpu_sampler(interval=0.01)
+        await asyncio.sleep(0.1)
+        assert system_tools._cpu_percent is not None
+        system_tools.stop_cpu_sampler()
+    
+    asyncio.run(run_sampler())
+    
+    assert system_tools._cpu_percent is None
+    assert system_tools._cpu_percent_per_core is None
+
+
+def test_cpu_percent_sample_is_shared_while_fresh(monkeypatch):
+    calls = []
+    
+    def fake_cpu_percent(interval=None, percpu=False):
+        calls.append(percpu)
+        return [1.0, 2.0] if percpu else 1.5
+    
+    monkeypatch.setattr(platform_utils.psutil, 'cpu_percent', fake_cpu_percent)
+    monkeypatch.setattr(platform_utils, '_cpu_sample', None)
+    
+    platform_utils.get_cpu_percent()  # primes the baseline, never reused
+    first = platform_utils.get_cpu_percent(max_age=60)
+    second = platform_utils.get_cpu_percent(max_age=60)
+    
+    assert first == second == (1.5, [1.0, 2.0])
+    assert len(calls) == 4